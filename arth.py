@@ -1,30 +1,25 @@
+import time
 import tkinter as tk
-import random
 from playsound import playsound # play mp3 or wav
+from quiz_questions import QuestionBank, Response
+from quiz_sessions import SESSION_LOG, append_response, format_summary, new_session_id, read_responses, summarize
 
 # --------------------------
 # GLOBAL VARS FOR TIMER
 # --------------------------
 timer_id = None
-time_left = 0
+deadline = 0 # time.monotonic() at which the current question times out
+question_started = 0 # time.monotonic() when the current question was shown
+TIMER_TICK = 0.1 # seconds between timer display updates
+response_times = [] # a Response for each finished question of the current round
+attempt_times = [] # seconds after question_started at which each answer was submitted
+session_id = None # groups a round's rows in the session log
 
 # --------------------------
-# QUIZ LOGIC
+# QUESTION BANKS
 # --------------------------
-def randomInt(level):
-    if level == "easy":
-        return random.randint(1, 9), random.randint(1, 9)
-    elif level == "moderate":
-        return random.randint(10, 99), random.randint(10, 99)
-    else:
-        return random.randint(1000, 9999), random.randint(1000, 9999)
-
-def decideOperation():
-    return random.choice(["+", "-"])
-
-def isCorrect(num1, num2, op, ans):
-    # Using eval is generally risky, but acceptable here for simple math quiz logic
-    return ans == eval(f"{num1}{op}{num2}")
+QUIZ_SEED = None # set to an int to replay the same sequence of rounds
+question_banks = {} # difficulty -> QuestionBank of pre-generated rounds
 
 # --------------------------
 # SOUND EFFECTS
@@ -83,29 +78,42 @@ def create_bubbly_button(parent, text, command=None, width=16):
 # --------------------------
 # TIMER LOGIC
 # --------------------------
-def start_timer(seconds, entry_widget, submit_button, feedback_label, timer_label):
+def time_remaining():
+    return max(0.0, deadline - time.monotonic())
+
+def start_timer(seconds):
     """Starts the countdown timer for the current question."""
-    global time_left, timer_id, num1, num2, operation
-    time_left = seconds
+    global deadline
+    deadline = time.monotonic() + seconds
+    resume_timer()
+
+def resume_timer():
+    """Restarts the countdown display without moving the deadline (e.g. after a wrong attempt)."""
+    global timer_id
     
     # Cancel any existing timer
     if timer_id:
         root.after_cancel(timer_id)
 
     def countdown():
-        global time_left, timer_id
-        if time_left > 0:
-            time_left -= 1
-            timer_label.config(text=f"Time: {time_left}s")
-            timer_id = root.after(1000, countdown) # Schedule next update
+        global timer_id
+        # The deadline, not a count of ticks, decides the time left, so late ticks never add time
+        remaining = time_remaining()
+        if remaining > 0:
+            quiz["timer"].config(text=f"Time: {remaining:.1f}s")
+            # Wake on the next tenth of a second
+            delay = remaining % TIMER_TICK or TIMER_TICK
+            timer_id = root.after(max(1, round(delay * 1000)), countdown) # Schedule next update
         else:
             # Time's up!
-            timer_label.config(text="Time's Up!", fg="red")
-            feedback_label.config(text=f"⏰ Time's Up! Ans: {eval(f'{num1}{operation}{num2}')}", fg="red")
+            timer_id = None
+            record_response("timeout")
+            quiz["timer"].config(text="Time's Up!", fg="red")
+            quiz["feedback"].config(text=f"⏰ Time's Up! Ans: {answer}", fg="red")
             
             # Disable input and submission
-            entry_widget.config(state='disabled')
-            submit_button.pack_forget() # Hide the submit button
+            quiz["entry"].config(state='disabled')
+            quiz["submit"].pack_forget() # Hide the submit button
             
             play_fail_sound()
             root.unbind("<Return>") # Unbind the Enter key
@@ -114,144 +122,238 @@ def start_timer(seconds, entry_widget, submit_button, feedback_label, timer_labe
 
     countdown()
 
+def record_response(outcome):
+    """Stores how long the current question took and how it ended, and appends it to the session log."""
+    response = Response(difficulty, round_questions[question_number], len(attempt_times),
+                        time.monotonic() - question_started, outcome, tuple(attempt_times))
+    response_times.append(response)
+    try:
+        append_response(session_id, response, SESSION_LOG)
+    except OSError:
+        pass # the quiz carries on without a log
+
 # --------------------------
 # SCREENS
 # --------------------------
-def displayMenu():
-    # Cancel timer if returning from quiz
-    global timer_id
-    if timer_id:
-        root.after_cancel(timer_id)
-        timer_id = None
-        
-    for w in root.winfo_children():
-        w.destroy()
-
-    root.configure(bg="#fff1e0")
-
-    tk.Label(root, text="🧮 ARITHMETIC QUIZ 🧮",
+# Each screen is built once by build_screens() and stacked in the same place;
+# switching screens raises one and questions only update widget text and state.
+screens = {}
+quiz = {} # quiz screen widgets updated for every question
+results = {} # results screen widgets
+analytics = {} # analytics screen widgets
+
+def build_screens():
+    for name in ("menu", "quiz", "results", "analytics"):
+        screens[name] = tk.Frame(root, bg="#fff1e0")
+        screens[name].place(relx=0, rely=0, relwidth=1, relheight=1)
+    build_menu_screen(screens["menu"])
+    build_quiz_screen(screens["quiz"])
+    build_results_screen(screens["results"])
+    build_analytics_screen(screens["analytics"])
+
+def show_screen(name):
+    screens[name].tkraise()
+
+def build_menu_screen(screen):
+    tk.Label(screen, text="🧮 ARITHMETIC QUIZ 🧮",
              bg="#fff1e0", fg="#ff4500",
              font=("Comic Sans MS", 24, "bold")).place(relx=0.5, rely=0.1, anchor="center")
 
-    frame = tk.Frame(root, bg="#fff1e0")
+    frame = tk.Frame(screen, bg="#fff1e0")
     frame.place(relx=0.5, rely=0.5, anchor="center")
 
     create_bubbly_button(frame, "🟢 Easy (10s)", lambda: start_quiz("easy")).pack(pady=10)
     create_bubbly_button(frame, "🟠 Moderate (20s)", lambda: start_quiz("moderate")).pack(pady=10)
     create_bubbly_button(frame, "🔴 Advanced (30s)", lambda: start_quiz("advanced")).pack(pady=10)
+    create_bubbly_button(frame, "📈 Stats", displayAnalytics).pack(pady=10)
 
-def displayProblem():
-    global num1, num2, operation, attempt, timer_id, time_left
-    attempt = 1
-    num1, num2 = randomInt(difficulty)
-    operation = decideOperation()
-
-    # Determine time limit based on difficulty
-    if difficulty == "easy":
-        time_limit = 10
-    elif difficulty == "moderate":
-        time_limit = 20
-    else:
-        time_limit = 30 # advanced
-
-    # Clear screen
-    for w in root.winfo_children():
-        w.destroy()
-
-    root.configure(bg="#fff1e0")
-
+def build_quiz_screen(screen):
     # --- Header Frame (for Back and Difficulty) ---
-    header_frame = tk.Frame(root, bg="#fff1e0")
+    header_frame = tk.Frame(screen, bg="#fff1e0")
     header_frame.pack(pady=10, fill="x")
 
-    tk.Label(header_frame, text=f"Difficulty: {difficulty.capitalize()}",
-             bg="#fff1e0", fg="#ff7043",
-             font=("Comic Sans MS", 14, "bold")).pack(side="left", padx=20)
+    quiz["difficulty"] = tk.Label(header_frame, text="",
+                                  bg="#fff1e0", fg="#ff7043",
+                                  font=("Comic Sans MS", 14, "bold"))
+    quiz["difficulty"].pack(side="left", padx=20)
 
     back_btn = create_bubbly_button(header_frame, "⬅ Back", displayMenu, width=8)
     back_btn.pack(side="right", padx=20)
     
     # --- Timer Label (Placed in the center top) ---
-    timer_label = tk.Label(root, text=f"Time: {time_limit}s", 
-                           bg="#fff1e0", fg="#004d40", 
-                           font=("Comic Sans MS", 16, "bold"), 
-                           padx=10, pady=5, 
-                           relief="ridge", bd=2)
-    timer_label.place(relx=0.5, rely=0.18, anchor="center") # Centered placement
-
-    tk.Label(root, text=f"Question {question_number + 1}/10",
+    quiz["timer"] = tk.Label(screen, text="",
+                             bg="#fff1e0", fg="#004d40",
+                             font=("Comic Sans MS", 16, "bold"),
+                             padx=10, pady=5,
+                             relief="ridge", bd=2)
+    quiz["timer"].place(relx=0.5, rely=0.18, anchor="center") # Centered placement
+
+    quiz["number"] = tk.Label(screen, text="",
+                              bg="#fff1e0", fg="#ff4500",
+                              font=("Comic Sans MS", 16, "bold"))
+    quiz["number"].pack(pady=50) # Increased padding to account for timer
+
+    quiz["problem"] = tk.Label(screen, text="",
+                               bg="#fff1e0", fg="#e64a19",
+                               font=("Impact", 40))
+    quiz["problem"].pack(pady=10)
+
+    quiz["entry"] = tk.Entry(screen, font=("Comic Sans MS", 22), justify="center", width=6, bd=3, relief="ridge")
+    quiz["entry"].pack(pady=10)
+
+    quiz["feedback"] = tk.Label(screen, text="", bg="#fff1e0", font=("Comic Sans MS", 16))
+    quiz["feedback"].pack(pady=10)
+
+    quiz["submit"] = create_bubbly_button(screen, "✅ Submit", submit, width=16)
+    quiz["submit"].pack(pady=20)
+
+def build_results_screen(screen):
+    results["message"] = tk.Label(screen, text="", bg="#fff1e0",
+                                  font=("Comic Sans MS", 24, "bold"))
+    results["message"].pack(pady=20)
+
+    results["score"] = tk.Label(screen, text="", bg="#fff1e0", fg="#e64a19",
+                                font=("Comic Sans MS", 18, "bold"))
+    results["score"].pack(pady=10)
+
+    results["grade"] = tk.Label(screen, text="", bg="#fff1e0", fg="#ff7043",
+                                font=("Comic Sans MS", 18, "bold"))
+    results["grade"].pack(pady=10)
+
+    results["timing"] = tk.Label(screen, text="", bg="#fff1e0", fg="#004d40",
+                                 font=("Comic Sans MS", 14))
+    results["timing"].pack(pady=5)
+
+    frame = tk.Frame(screen, bg="#fff1e0")
+    frame.pack(pady=20)
+
+    create_bubbly_button(frame, "🔁 Play Again", displayMenu).pack(pady=5)
+    create_bubbly_button(frame, "🚪 Exit", root.destroy).pack(pady=5)
+
+def build_analytics_screen(screen):
+    tk.Label(screen, text="📈 ANSWER TIMES 📈",
              bg="#fff1e0", fg="#ff4500",
-             font=("Comic Sans MS", 16, "bold")).pack(pady=50) # Increased padding to account for timer
+             font=("Comic Sans MS", 20, "bold")).pack(pady=20)
+
+    analytics["summary"] = tk.Label(screen, text="", bg="#fff1e0", fg="#004d40",
+                                    font=("Courier", 11), justify="left")
+    analytics["summary"].pack(pady=10)
 
-    tk.Label(root, text=f"{num1} {operation} {num2} =",
-             bg="#fff1e0", fg="#e64a19",
-             font=("Impact", 40)).pack(pady=10)
+    create_bubbly_button(screen, "⬅ Back", displayMenu, width=8).pack(pady=20)
+
+def displayAnalytics():
+    # Latency percentiles by difficulty and operation over every logged session
+    try:
+        summary = summarize(logged.response for logged in read_responses(SESSION_LOG))
+        text = format_summary(summary)
+    except OSError as e:
+        text = f"Could not read {SESSION_LOG}: {e}"
+    analytics["summary"].config(text=text)
+    show_screen("analytics")
 
-    entry = tk.Entry(root, font=("Comic Sans MS", 22), justify="center", width=6, bd=3, relief="ridge")
-    entry.pack(pady=10)
-    entry.focus()
+def displayMenu():
+    # Cancel timer if returning from quiz
+    global timer_id
+    if timer_id:
+        root.after_cancel(timer_id)
+        timer_id = None
+    root.unbind("<Return>")
 
-    feedback = tk.Label(root, text="", bg="#fff1e0", font=("Comic Sans MS", 16))
-    feedback.pack(pady=10)
+    show_screen("menu")
 
-    submit_btn_frame = create_bubbly_button(root, "✅ Submit", lambda: submit(entry, feedback, submit_btn_frame), width=16)
-    submit_btn_frame.pack(pady=20)
+def displayProblem():
+    global num1, num2, operation, answer, attempt, question_started, attempt_times
+    attempt = 1
+    attempt_times = []
+    # Served from the round generated in start_quiz; submit and the timer just compare against the answer
+    num1, num2, operation, answer = round_questions[question_number]
 
+    # Determine time limit based on difficulty
+    if difficulty == "easy":
+        time_limit = 10
+    elif difficulty == "moderate":
+        time_limit = 20
+    else:
+        time_limit = 30 # advanced
 
-    def submit(entry_widget, feedback_label, submit_frame, event=None):
-        global score, question_number, attempt, timer_id
-        
-        # Cancel the timer immediately upon submission
-        if timer_id:
-            root.after_cancel(timer_id)
-            timer_id = None
-        
-        try:
-            ans = int(entry_widget.get())
-        except ValueError:
-            feedback_label.config(text="⚠️ Enter a number!", fg="red")
-            play_fail_sound()
-            # Restart the timer since it was a non-scoring attempt
-            start_timer(time_left, entry, submit_frame, feedback, timer_label)
-            return
-
-        # Disable input and submission while processing
-        entry_widget.config(state='disabled')
-        submit_frame.pack_forget()
-        root.unbind("<Return>")
-
-        if isCorrect(num1, num2, operation, ans):
-            feedback_label.config(text="✅ Correct!", fg="green")
-            play_correct_sound()
-            if attempt == 1:
-                score += 10
-            elif attempt == 2:
-                score += 7
-            else:
-                score += 5
-            root.after(1000, next_question)
-        else:
-            play_fail_sound()
-            if attempt < 3:
-                feedback_label.config(text=f"❌ Wrong! Attempt {attempt}/3", fg="red")
-                attempt += 1
-                entry_widget.delete(0, tk.END)
-                # Re-enable input and submission, restart timer
-                entry_widget.config(state='normal')
-                entry_widget.focus()
-                submit_frame.pack(pady=20)
-                root.bind("<Return>", lambda e: submit(entry, feedback, submit_frame))
-                # Restart timer with remaining time
-                start_timer(time_left, entry, submit_frame, feedback, timer_label)
-            else:
-                feedback_label.config(text=f"❌ Out of tries! Ans: {eval(f'{num1}{operation}{num2}')}", fg="red")
-                root.after(1500, next_question)
+    # Update the quiz screen in place
+    quiz["difficulty"].config(text=f"Difficulty: {difficulty.capitalize()}")
+    quiz["timer"].config(text=f"Time: {time_limit:.1f}s", fg="#004d40")
+    quiz["number"].config(text=f"Question {question_number + 1}/10")
+    quiz["problem"].config(text=f"{num1} {operation} {num2} =")
+    quiz["entry"].config(state='normal')
+    quiz["entry"].delete(0, tk.END)
+    quiz["feedback"].config(text="")
+    quiz["submit"].pack(pady=20) # shown again if the last question hid it
+    show_screen("quiz")
+    quiz["entry"].focus()
 
     # Bind Enter key to the submit function
-    root.bind("<Return>", lambda e: submit(entry, feedback, submit_btn_frame))
+    root.bind("<Return>", submit)
 
     # Start the timer!
-    start_timer(time_limit, entry, submit_btn_frame, feedback, timer_label)
+    question_started = time.monotonic()
+    start_timer(time_limit)
+
+def submit(event=None):
+    global score, attempt, timer_id
+    entry_widget = quiz["entry"]
+    feedback_label = quiz["feedback"]
+    
+    # Cancel the timer immediately upon submission
+    if timer_id:
+        root.after_cancel(timer_id)
+        timer_id = None
+    
+    # An answer that arrives after the deadline but before the final tick is a timeout;
+    # resume_timer's first check runs the time's-up handling straight away
+    if time_remaining() == 0:
+        resume_timer()
+        return
+    
+    try:
+        ans = int(entry_widget.get())
+    except ValueError:
+        feedback_label.config(text="⚠️ Enter a number!", fg="red")
+        play_fail_sound()
+        # Resume the timer since it was a non-scoring attempt
+        resume_timer()
+        return
+    attempt_times.append(time.monotonic() - question_started)
+
+    # Disable input and submission while processing
+    entry_widget.config(state='disabled')
+    quiz["submit"].pack_forget()
+    root.unbind("<Return>")
+
+    if ans == answer:
+        record_response("correct")
+        feedback_label.config(text="✅ Correct!", fg="green")
+        play_correct_sound()
+        if attempt == 1:
+            score += 10
+        elif attempt == 2:
+            score += 7
+        else:
+            score += 5
+        root.after(1000, next_question)
+    else:
+        play_fail_sound()
+        if attempt < 3:
+            feedback_label.config(text=f"❌ Wrong! Attempt {attempt}/3", fg="red")
+            attempt += 1
+            # Re-enable input and submission, restart timer
+            entry_widget.config(state='normal')
+            entry_widget.delete(0, tk.END)
+            entry_widget.focus()
+            quiz["submit"].pack(pady=20)
+            root.bind("<Return>", submit)
+            # Resume the timer towards the same deadline
+            resume_timer()
+        else:
+            record_response("wrong")
+            feedback_label.config(text=f"❌ Out of tries! Ans: {answer}", fg="red")
+            root.after(1500, next_question)
 
 def next_question():
     global question_number, timer_id
@@ -279,47 +381,52 @@ def displayResults():
         play_finish_sound()
     else:
         play_fail_score_sound() # New fail sound for low score
-        
-    for w in root.winfo_children():
-        w.destroy()
-
-    root.configure(bg="#fff1e0")
 
     # Determine message and color based on performance
     result_text = "🎉 QUIZ COMPLETE! WELL DONE! 🎉" if score >= 50 else "😔 QUIZ COMPLETE! TRY HARDER! 😔"
     result_color = "#4CAF50" if score >= 50 else "#F44336"
 
-    tk.Label(root, text=result_text,
-             bg="#fff1e0", fg=result_color,
-             font=("Comic Sans MS", 24, "bold")).pack(pady=20)
-
-    tk.Label(root, text=f"Score: {score}/100", bg="#fff1e0", fg="#e64a19",
-             font=("Comic Sans MS", 18, "bold")).pack(pady=10)
+    results["message"].config(text=result_text, fg=result_color)
+    results["score"].config(text=f"Score: {score}/100")
 
     grade = "A+" if score >= 90 else "A" if score >= 80 else "B" if score >= 70 else "C" if score >= 60 else "F"
-    tk.Label(root, text=f"Grade: {grade}", bg="#fff1e0", fg="#ff7043",
-             font=("Comic Sans MS", 18, "bold")).pack(pady=10)
+    results["grade"].config(text=f"Grade: {grade}")
 
-    frame = tk.Frame(root, bg="#fff1e0")
-    frame.pack(pady=20)
+    if response_times:
+        seconds = [response.seconds for response in response_times]
+        results["timing"].config(text=f"Average answer time: {sum(seconds) / len(seconds):.1f}s "
+                                      f"(fastest {min(seconds):.1f}s)")
 
-    create_bubbly_button(frame, "🔁 Play Again", displayMenu).pack(pady=5)
-    create_bubbly_button(frame, "🚪 Exit", root.destroy).pack(pady=5)
+    show_screen("results")
 
 def start_quiz(level):
-    global difficulty, score, question_number
+    global difficulty, score, question_number, round_questions, response_times, session_id
     difficulty = level
     score = 0
     question_number = 0
+    response_times = []
+    session_id = new_session_id()
+    if level not in question_banks:
+        question_banks[level] = QuestionBank(level, seed=QUIZ_SEED)
+    round_questions = question_banks[level].next_round() # 10 distinct questions
     displayProblem()
 
 
 # --------------------------
 # MAIN APP SETUP
 # --------------------------
-root = tk.Tk()
-root.title("🎮 Arithmetic Quiz Game")
-root.geometry("520x520")
-root.resizable(False, False)
-displayMenu()
-root.mainloop()
\ No newline at end of file
+def setup_root():
+    """Creates the window and builds every screen once."""
+    global root
+    root = tk.Tk()
+    root.title("🎮 Arithmetic Quiz Game")
+    root.geometry("520x520")
+    root.resizable(False, False)
+    root.configure(bg="#fff1e0")
+    build_screens()
+    return root
+
+if __name__ == "__main__":
+    setup_root()
+    displayMenu()
+    root.mainloop()
@@ -0,0 +1,121 @@
+"""Benchmarks for the arithmetic quiz question logic.
+
+Run with: python bench_arth.py
+"""
+import random
+import statistics
+import time
+import timeit
+
+from quiz_questions import OPERATIONS, decideOperation, generate_rounds, make_question, randomInt
+
+
+def eval_question(level):
+    """The original flow: pick numbers, then eval the expression to check an answer"""
+    num1, num2 = randomInt(level)
+    operation = decideOperation()
+    return num1, num2, operation, eval(f"{num1}{operation}{num2}")
+
+
+def bench_question_generation(count=1000000):
+    print(f"{'level':>10} {'eval':>10} {'table':>10}")
+    for level in ("easy", "moderate", "advanced"):
+        random.seed(1)
+        with_eval = timeit.timeit(lambda: eval_question(level), number=count)
+        random.seed(1)
+        with_table = timeit.timeit(lambda: make_question(level), number=count)
+        print(f"{level:>10} {with_eval / count * 1e9:>8.0f}ns {with_table / count * 1e9:>8.0f}ns")
+
+
+def bench_answer_check(count=1000000):
+    questions = [make_question("advanced", tuple(OPERATIONS)) for _ in range(1000)]
+    answers = [q.answer for q in questions]
+    with_eval = timeit.timeit(
+        lambda: [ans == eval(f"{q.num1}{q.operation.replace('×', '*').replace('÷', '//')}{q.num2}")
+                 for q, ans in zip(questions, answers)], number=count // 1000)
+    stored = timeit.timeit(lambda: [ans == q.answer for q, ans in zip(questions, answers)], number=count // 1000)
+    print(f"answer check: eval {with_eval / count * 1e9:.0f}ns, stored answer {stored / count * 1e9:.0f}ns")
+
+
+def bench_round_batches(rounds=100000, questions=10):
+    count = rounds * questions
+    print(f"{'level':>10} {'one by one':>12} {'batched':>10}")
+    for level in ("easy", "moderate", "advanced"):
+        single = timeit.timeit(lambda: [[make_question(level) for _ in range(questions)] for _ in range(rounds)],
+                               number=1)
+        batched = timeit.timeit(lambda: generate_rounds(level, rounds, questions, seed=1), number=1)
+        print(f"{level:>10} {single / count * 1e9:>10.0f}ns {batched / count * 1e9:>8.0f}ns")
+
+
+def simulate_timer(seconds, deadline_based, lateness=0.04, tick=0.1, seed=1):
+    """Seconds until time-up on a virtual clock where every after() callback runs up to `lateness` late"""
+    rng = random.Random(seed)
+    clock = 0.0
+    if deadline_based:
+        # arth.resume_timer: wake on the next tick and compare against a fixed deadline
+        while seconds - clock > 0:
+            delay = (seconds - clock) % tick or tick
+            clock += delay + rng.uniform(0, lateness)
+        return clock
+    # The original countdown: one decrement per 1000ms callback
+    for _ in range(seconds):
+        clock += 1 + rng.uniform(0, lateness)
+    return clock
+
+
+def bench_timer_drift(limits=(10, 20, 30)):
+    print(f"{'limit':>6} {'tick counting':>14} {'deadline':>10}")
+    for seconds in limits:
+        print(f"{seconds:>5}s {simulate_timer(seconds, False):>13.2f}s {simulate_timer(seconds, True):>9.2f}s")
+
+
+def widget_paths(widget):
+    """Tk path names of widget and every widget below it"""
+    paths = {str(widget)}
+    for child in widget.winfo_children():
+        paths |= widget_paths(child)
+    return paths
+
+
+def bench_screen_transitions(questions=200):
+    """Time question-to-question transitions in arth.py (needs a display and the game's dependencies)"""
+    import arth
+    root = arth.setup_root()
+    arth.start_quiz("easy")
+
+    def rebuild():
+        # The original flow: throw away the question screen and build it again for every question
+        arth.screens["quiz"].destroy()
+        arth.screens["quiz"] = arth.tk.Frame(root, bg="#fff1e0")
+        arth.screens["quiz"].place(relx=0, rely=0, relwidth=1, relheight=1)
+        arth.build_quiz_screen(arth.screens["quiz"])
+        arth.displayProblem()
+
+    print(f"{'transition':>10} {'median':>10} {'p95':>10} {'widgets':>8} {'created/question':>17}")
+    for name, show in (("rebuild", rebuild), ("in place", arth.displayProblem)):
+        times = []
+        created = 0
+        for _ in range(questions):
+            before = widget_paths(root)
+            start = time.perf_counter()
+            show()
+            root.update() # include geometry management and drawing
+            times.append(time.perf_counter() - start)
+            created += len(widget_paths(root) - before)
+        times.sort()
+        print(f"{name:>10} {statistics.median(times) * 1e3:>8.2f}ms {times[int(len(times) * 0.95)] * 1e3:>8.2f}ms "
+              f"{len(widget_paths(root)) - 1:>8} {created / questions:>17.0f}")
+    arth.displayMenu()
+    root.destroy()
+
+
+if __name__ == "__main__":
+    bench_question_generation()
+    print()
+    bench_answer_check()
+    print()
+    bench_round_batches()
+    print()
+    bench_timer_drift()
+    print()
+    bench_screen_transitions()
@@ -0,0 +1,164 @@
+"""Benchmarks for the StudentManager data layer.
+
+Run with: python bench_student.py
+"""
+import os
+import random
+import tempfile
+import timeit
+
+from student import Student, StudentManager, convert_roster
+from student_cohorts import analyze_cohorts
+
+FIRST_NAMES = ["John", "Emma", "Michael", "Sarah", "David", "Lee", "Matt", "Sam", "Jake", "Amy"]
+LAST_NAMES = ["Smith", "Johnson", "Brown", "Davis", "Wilson", "Scott", "Thompson", "Hobbs", "Curry"]
+
+
+def write_roster(path, size, seed=1):
+    """Write a studentMarks-style file with size random students"""
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"{size}\n")
+        for code in range(100000, 100000 + size):
+            name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {code}"
+            marks = [rng.randint(0, 20) for _ in range(3)] + [rng.randint(0, 100)]
+            f.write(f"{code},{name},{marks[0]},{marks[1]},{marks[2]},{marks[3]}\n")
+
+
+class PropertyStudent:
+    """The original Student, recomputing every derived score on access"""
+    def __init__(self, student_code, name, mark1, mark2, mark3, exam_mark):
+        self.student_code = int(student_code)
+        self.name = name
+        self.mark1 = int(mark1)
+        self.mark2 = int(mark2)
+        self.mark3 = int(mark3)
+        self.exam_mark = int(exam_mark)
+
+    @property
+    def coursework_total(self):
+        return self.mark1 + self.mark2 + self.mark3
+
+    @property
+    def total_score(self):
+        return self.coursework_total + self.exam_mark
+
+    @property
+    def percentage(self):
+        return (self.total_score / 160) * 100
+
+    @property
+    def grade(self):
+        percentage = self.percentage
+        if percentage >= 70:
+            return 'A'
+        elif percentage >= 60:
+            return 'B'
+        elif percentage >= 50:
+            return 'C'
+        elif percentage >= 40:
+            return 'D'
+        else:
+            return 'F'
+
+
+def bench_attribute_access(count=100000):
+    rng = random.Random(3)
+    rows = [(1000 + i, "Student", rng.randint(0, 20), rng.randint(0, 20), rng.randint(0, 20), rng.randint(0, 100))
+            for i in range(count)]
+    print(f"{'class':>16} {'grade':>10} {'percentage':>12} {'table row':>12}")
+    for cls in (PropertyStudent, Student):
+        students = [cls(*row) for row in rows]
+        grade = timeit.timeit(lambda: [s.grade for s in students], number=1)
+        percentage = timeit.timeit(lambda: [s.percentage for s in students], number=1)
+        table_row = timeit.timeit(lambda: [(s.coursework_total, s.exam_mark, s.percentage, s.grade)
+                                           for s in students], number=1)
+        print(f"{cls.__name__:>16} {grade / count * 1e9:>8.0f}ns {percentage / count * 1e9:>10.0f}ns "
+              f"{table_row / count * 1e9:>10.0f}ns")
+
+
+def bench_lookup_and_insert(sizes=(1000, 10000, 100000), repeat=2000):
+    print(f"{'roster':>10} {'by code':>12} {'by name':>12} {'add':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"marks_{size}.txt")
+            write_roster(path, size)
+            manager = StudentManager(path)
+            rng = random.Random(2)
+            codes = [rng.randrange(100000, 100000 + size) for _ in range(repeat)]
+            names = [manager.get_student_by_code(c).name.upper() for c in codes]
+
+            code_time = timeit.timeit(lambda: [manager.get_student_by_code(c) for c in codes], number=1)
+            name_time = timeit.timeit(lambda: [manager.get_student_by_name(n) for n in names], number=1)
+
+            new_codes = iter(range(10 ** 7, 10 ** 7 + repeat))
+            add_time = timeit.timeit(
+                lambda: manager.add_student(next(new_codes), "Bench Student", 10, 10, 10, 50),
+                number=repeat)
+
+            print(f"{size:>10} {code_time / repeat * 1e6:>10.2f}us "
+                  f"{name_time / repeat * 1e6:>10.2f}us {add_time / repeat * 1e6:>10.2f}us")
+
+
+def bench_load_formats(size=200000):
+    with tempfile.TemporaryDirectory() as tmp:
+        text_path = os.path.join(tmp, "marks.txt")
+        binary_path = os.path.join(tmp, "marks.bin")
+        write_roster(text_path, size)
+        convert_roster(text_path, binary_path)
+        for path in (text_path, binary_path):
+            elapsed = timeit.timeit(lambda: StudentManager(path), number=1)
+            print(f"{os.path.basename(path):>10} {os.path.getsize(path) / 1e6:>8.1f}MB {elapsed:>8.2f}s")
+
+
+def bench_bulk_add(size=50000):
+    rows = [(10 ** 7 + i, f"Bulk Student {i}", 10, 10, 10, 50) for i in range(size)]
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("marks.txt", "marks.db"):
+            one_by_one = StudentManager(os.path.join(tmp, "single_" + name))
+            single = timeit.timeit(lambda: [one_by_one.add_student(*row) for row in rows], number=1)
+            bulk_manager = StudentManager(os.path.join(tmp, "bulk_" + name))
+            bulk = timeit.timeit(lambda: bulk_manager.bulk_add(rows), number=1)
+            print(f"{name:>10} add_student {single:>6.2f}s bulk_add {bulk:>6.2f}s")
+
+
+def bench_name_search(size=1000000, repeat=200):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "marks.txt")
+        write_roster(path, size)
+        manager = StudentManager(path)
+        manager.match_name_prefix("")  # sort the name keys once
+        # Prefixes as typed one keystroke at a time, from very broad to unique
+        for prefix in ("j", "jake", "jake cu", "jake curry 1", "jake curry 1000"):
+            elapsed = timeit.timeit(lambda: manager.match_name_prefix(prefix)[:30], number=repeat)
+            matches = len(manager.match_name_prefix(prefix))
+            print(f"{prefix!r:>20} {matches:>8} matches {elapsed / repeat * 1e6:>8.1f}us")
+        build = timeit.timeit(manager.build_fuzzy_index, number=1)
+        print(f"trigram index built in {build:.2f}s")
+        for name in ("sara smth", "davd wilsn 100500", "jake cury"):
+            elapsed = timeit.timeit(lambda: manager.fuzzy_search(name), number=5)
+            print(f"{name!r:>20} fuzzy {elapsed / 5 * 1e3:>8.1f}ms")
+
+
+def bench_cohorts(files=64, size=20000):
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, f"cohort_{i}.txt") for i in range(files)]
+        for i, path in enumerate(paths):
+            write_roster(path, size, seed=i)
+        serial = timeit.timeit(lambda: analyze_cohorts(paths, max_workers=1), number=1)
+        parallel = timeit.timeit(lambda: analyze_cohorts(paths), number=1)
+        print(f"{files} files x {size}: serial {serial:.2f}s, process pool ({os.cpu_count()} cores) {parallel:.2f}s")
+
+
+if __name__ == "__main__":
+    bench_lookup_and_insert()
+    print()
+    bench_attribute_access()
+    print()
+    bench_load_formats()
+    print()
+    bench_bulk_add()
+    print()
+    bench_cohorts()
+    print()
+    bench_name_search()
@@ -0,0 +1,146 @@
+import random
+import operator
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError: # batches fall back to a pure Python generator
+    np = None
+
+# --------------------------
+# OPERATOR TABLE
+# --------------------------
+# Display symbol -> function computing the answer
+OPERATIONS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "×": operator.mul,
+    "÷": operator.floordiv, # questions are generated so the division is exact
+}
+
+# Operations used by the quiz unless a caller asks for others
+DEFAULT_OPERATIONS = ("+", "-")
+
+# A question with its answer worked out once, when it is generated
+Question = namedtuple("Question", "num1 num2 operation answer")
+
+# How one question went: the number of answers submitted, seconds from showing
+# it to the final outcome ("correct", "wrong" once out of tries, or "timeout")
+# and the seconds at which each answer was submitted
+Response = namedtuple("Response", "difficulty question attempts seconds outcome attempt_times")
+
+# Inclusive range of both numbers for each difficulty; anything else counts as advanced
+LEVEL_RANGES = {
+    "easy": (1, 9),
+    "moderate": (10, 99),
+    "advanced": (1000, 9999),
+}
+
+# --------------------------
+# QUESTION GENERATION
+# --------------------------
+def level_range(level):
+    return LEVEL_RANGES.get(level, LEVEL_RANGES["advanced"])
+
+def randomInt(level):
+    low, high = level_range(level)
+    return random.randint(low, high), random.randint(low, high)
+
+def decideOperation(operations=DEFAULT_OPERATIONS):
+    return random.choice(operations)
+
+def make_question(level, operations=DEFAULT_OPERATIONS):
+    """Pick the numbers and operation for a question and compute its answer."""
+    num1, num2 = randomInt(level)
+    operation = decideOperation(operations)
+    if operation == "÷":
+        num1 *= num2 # keep the answer a whole number
+    return Question(num1, num2, operation, OPERATIONS[operation](num1, num2))
+
+# --------------------------
+# QUESTION BATCHES
+# --------------------------
+def make_rng(seed=None):
+    """A random generator for generate_rounds; an existing generator is passed straight through."""
+    if np is not None:
+        return np.random.default_rng(seed)
+    return seed if isinstance(seed, random.Random) else random.Random(seed)
+
+def generate_rounds(level, rounds=1, questions=10, operations=DEFAULT_OPERATIONS, seed=None):
+    """Build `rounds` rounds of `questions` distinct questions each, answers included.
+
+    With NumPy every number, operation and answer in the batch is drawn and
+    computed in whole-array operations; positions that repeat an earlier
+    question in their round are redrawn until none are left. The same seed
+    gives the same rounds (for a given NumPy/pure Python backend).
+    """
+    low, high = level_range(level)
+    span = high - low + 1
+    if questions > span * span * len(operations):
+        raise ValueError(f"only {span * span * len(operations)} distinct {level} questions exist")
+    rng = make_rng(seed)
+    if np is None:
+        return [_generate_round(rng, low, high, questions, operations) for _ in range(rounds)]
+
+    shape = (rounds, questions)
+    num1 = rng.integers(low, high + 1, size=shape)
+    num2 = rng.integers(low, high + 1, size=shape)
+    ops = rng.integers(0, len(operations), size=shape)
+    while True:
+        duplicates = _repeated_in_row((num1 * span + num2) * len(operations) + ops)
+        count = int(duplicates.sum())
+        if not count:
+            break
+        num1[duplicates] = rng.integers(low, high + 1, size=count)
+        num2[duplicates] = rng.integers(low, high + 1, size=count)
+        ops[duplicates] = rng.integers(0, len(operations), size=count)
+
+    answers = np.empty(shape, dtype=np.int64)
+    for i, operation in enumerate(operations):
+        mask = ops == i
+        if operation == "÷":
+            num1[mask] *= num2[mask] # keep the answer a whole number
+        # The table's functions work element-wise on arrays too
+        answers[mask] = OPERATIONS[operation](num1[mask], num2[mask])
+
+    symbols = [list(map(operations.__getitem__, row)) for row in ops.tolist()]
+    return [list(map(Question, *row)) for row in zip(num1.tolist(), num2.tolist(), symbols, answers.tolist())]
+
+def _repeated_in_row(keys):
+    """Boolean mask of entries equal to an earlier entry in the same row"""
+    order = np.argsort(keys, axis=1, kind="stable")
+    ordered = np.take_along_axis(keys, order, axis=1)
+    repeated = np.zeros(keys.shape, dtype=bool)
+    np.put_along_axis(repeated, order[:, 1:], ordered[:, 1:] == ordered[:, :-1], axis=1)
+    return repeated
+
+def _generate_round(rng, low, high, questions, operations):
+    seen = set()
+    round_questions = []
+    while len(round_questions) < questions:
+        num1, num2 = rng.randint(low, high), rng.randint(low, high)
+        operation = rng.choice(operations)
+        if (num1, num2, operation) in seen:
+            continue
+        seen.add((num1, num2, operation))
+        if operation == "÷":
+            num1 *= num2
+        round_questions.append(Question(num1, num2, operation, OPERATIONS[operation](num1, num2)))
+    return round_questions
+
+class QuestionBank:
+    """Serves quiz rounds from batches generated ahead of time."""
+    def __init__(self, level, questions=10, operations=DEFAULT_OPERATIONS, seed=None, batch_size=100):
+        self.level = level
+        self.questions = questions
+        self.operations = operations
+        self.batch_size = batch_size
+        self.rng = make_rng(seed)
+        self.rounds = []
+
+    def next_round(self):
+        if not self.rounds:
+            self.rounds = generate_rounds(self.level, self.batch_size, self.questions,
+                                          self.operations, seed=self.rng)
+            self.rounds.reverse() # pop() then serves them in generated order
+        return self.rounds.pop()
@@ -0,0 +1,106 @@
+import io
+import os
+import csv
+import sys
+import time
+from collections import namedtuple
+
+from quiz_questions import Question, Response
+
+# --------------------------
+# SESSION LOG FORMAT
+# --------------------------
+# One CSV row per finished question, appended as the quiz goes; attempt times
+# are seconds since the question was shown, separated by ";".
+SESSION_LOG = "quiz_sessions.csv"
+LOG_FIELDS = ["session", "difficulty", "num1", "operation", "num2", "answer",
+              "outcome", "seconds", "attempt_times"]
+
+# A Response read back from the log, tagged with the session it came from
+LoggedResponse = namedtuple("LoggedResponse", "session response")
+
+def new_session_id():
+    """Wall-clock start time of a round; only used to group its rows."""
+    return int(time.time() * 1000)
+
+def append_response(session, response, path=SESSION_LOG):
+    """Appends one finished question to the session log."""
+    question = response.question
+    row = [session, response.difficulty, question.num1, question.operation, question.num2,
+           question.answer, response.outcome, f"{response.seconds:.3f}",
+           ";".join(f"{t:.3f}" for t in response.attempt_times)]
+    line = io.StringIO()
+    csv.writer(line).writerow(row)
+    with open(path, "ab+") as f:
+        # Start on a fresh line if a previous write was cut off mid-row
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) not in (b"\n", b"\r"):
+                f.write(b"\n")
+        f.write(line.getvalue().encode("utf-8"))
+
+def read_responses(path=SESSION_LOG):
+    """Yields a LoggedResponse for each row of the log, skipping rows that cannot be read."""
+    if not os.path.exists(path):
+        return
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            if len(row) != len(LOG_FIELDS):
+                continue # e.g. a row torn by a crash mid-write
+            try:
+                session, difficulty, num1, operation, num2, answer, outcome, seconds, attempt_times = row
+                question = Question(int(num1), int(num2), operation, int(answer))
+                times = tuple(float(t) for t in attempt_times.split(";") if t)
+                yield LoggedResponse(int(session), Response(difficulty, question, len(times), float(seconds),
+                                                            outcome, times))
+            except ValueError:
+                continue
+
+# --------------------------
+# ANALYTICS
+# --------------------------
+def percentile(ordered, q):
+    """Linearly interpolated percentile (0-100) of an already sorted list."""
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def summarize(responses):
+    """Latency (seconds to each question's outcome) percentiles per (difficulty, operation).
+
+    Returns {(difficulty, operation): {"count", "correct", "p50", "p90", "p95", "mean"}}.
+    """
+    groups = {}
+    for response in responses:
+        groups.setdefault((response.difficulty, response.question.operation), []).append(response)
+    summary = {}
+    for key, group in sorted(groups.items()):
+        seconds = sorted(response.seconds for response in group)
+        summary[key] = {
+            "count": len(group),
+            "correct": sum(response.outcome == "correct" for response in group),
+            "p50": percentile(seconds, 50),
+            "p90": percentile(seconds, 90),
+            "p95": percentile(seconds, 95),
+            "mean": sum(seconds) / len(seconds),
+        }
+    return summary
+
+def format_summary(summary):
+    """The summary as a fixed-width text table."""
+    lines = [f"{'difficulty':<10} {'op':>2} {'count':>6} {'correct':>8} {'p50':>6} {'p90':>6} {'p95':>6}"]
+    for (difficulty, operation), stats in summary.items():
+        lines.append(f"{difficulty:<10} {operation:>2} {stats['count']:>6} "
+                     f"{stats['correct'] / stats['count']:>7.0%} {stats['p50']:>5.1f}s "
+                     f"{stats['p90']:>5.1f}s {stats['p95']:>5.1f}s")
+    if len(lines) == 1:
+        lines.append("No questions answered yet.")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    # python quiz_sessions.py [log file]
+    path = sys.argv[1] if len(sys.argv) > 1 else SESSION_LOG
+    print(format_summary(summarize(logged.response for logged in read_responses(path))))
@@ -1,111 +1,1142 @@
-import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
 import os
+import sys
+import argparse
+import csv
+import sqlite3
+import mmap
+import struct
+import threading
+import heapq
+from collections import Counter
+from operator import attrgetter
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:  # the columnar backend is optional
+    np = None
+
+GRADES = ['A', 'B', 'C', 'D', 'F']
+
+# Student fields update_student may change; the rest are the key or derived from the marks
+EDITABLE_FIELDS = ('name', 'mark1', 'mark2', 'mark3', 'exam_mark')
+
+# Maximum of each mark component; the manager keeps an exact count histogram of each
+MARK_MAXIMUMS = {'mark1': 20, 'mark2': 20, 'mark3': 20, 'exam_mark': 100, 'coursework_total': 60}
+
+# Sortable fields: (Student attribute, StudentColumns attribute or None)
+SORT_FIELDS = {
+    'name': ('name', None),
+    'code': ('student_code', 'student_code'),
+    'coursework': ('coursework_total', 'coursework_total'),
+    'exam': ('exam_mark', 'exam_mark'),
+    'percentage': ('total_score', 'total_score'),
+    'grade': ('grade', 'grade_index'),
+}
+
+def grade_for_percentage(percentage):
+    if percentage >= 70:
+        return 'A'
+    elif percentage >= 60:
+        return 'B'
+    elif percentage >= 50:
+        return 'C'
+    elif percentage >= 40:
+        return 'D'
+    else:
+        return 'F'
 
 class Student:
+    # Derived scores are cached and recomputed whenever a mark is assigned
+    __slots__ = ('student_code', 'name', '_mark1', '_mark2', '_mark3', '_exam_mark',
+                 '_coursework_total', '_total_score', '_percentage', '_grade')
+    
     def __init__(self, student_code, name, mark1, mark2, mark3, exam_mark):
         self.student_code = int(student_code)
         self.name = name
-        self.mark1 = int(mark1)
-        self.mark2 = int(mark2)
-        self.mark3 = int(mark3)
-        self.exam_mark = int(exam_mark)
+        self._mark1 = int(mark1)
+        self._mark2 = int(mark2)
+        self._mark3 = int(mark3)
+        self._exam_mark = int(exam_mark)
+        self._update_derived()
+    
+    def _update_derived(self):
+        self._coursework_total = self._mark1 + self._mark2 + self._mark3
+        self._total_score = self._coursework_total + self._exam_mark
+        self._percentage = (self._total_score / 160) * 100
+        self._grade = grade_for_percentage(self._percentage)
+    
+    @property
+    def mark1(self):
+        return self._mark1
+    
+    @mark1.setter
+    def mark1(self, value):
+        self._mark1 = int(value)
+        self._update_derived()
+    
+    @property
+    def mark2(self):
+        return self._mark2
+    
+    @mark2.setter
+    def mark2(self, value):
+        self._mark2 = int(value)
+        self._update_derived()
+    
+    @property
+    def mark3(self):
+        return self._mark3
+    
+    @mark3.setter
+    def mark3(self, value):
+        self._mark3 = int(value)
+        self._update_derived()
+    
+    @property
+    def exam_mark(self):
+        return self._exam_mark
+    
+    @exam_mark.setter
+    def exam_mark(self, value):
+        self._exam_mark = int(value)
+        self._update_derived()
     
     @property
     def coursework_total(self):
-        return self.mark1 + self.mark2 + self.mark3
+        return self._coursework_total
     
     @property
     def total_score(self):
-        return self.coursework_total + self.exam_mark
+        return self._total_score
     
     @property
     def percentage(self):
-        return (self.total_score / 160) * 100
+        return self._percentage
     
     @property
     def grade(self):
-        percentage = self.percentage
-        if percentage >= 70:
-            return 'A'
-        elif percentage >= 60:
-            return 'B'
-        elif percentage >= 50:
-            return 'C'
-        elif percentage >= 40:
-            return 'D'
-        else:
-            return 'F'
+        return self._grade
 
-class StudentManager:
+def parse_student_line(line):
+    """Parse and validate one 'code,name,mark1,mark2,mark3,exam' line into a Student"""
+    data = line.strip().split(',')
+    if len(data) != 6:
+        raise ValueError(f"expected 6 fields, found {len(data)}")
+    return validate_student(Student(data[0], data[1].strip(), data[2], data[3], data[4], data[5]))
+
+def validate_student(student):
+    if not student.name:
+        raise ValueError("student name is empty")
+    if ',' in student.name or '\n' in student.name:
+        raise ValueError("student name cannot contain commas or line breaks")
+    if not all(0 <= mark <= 20 for mark in (student.mark1, student.mark2, student.mark3)):
+        raise ValueError("coursework marks must be 0-20")
+    if not (0 <= student.exam_mark <= 100):
+        raise ValueError("exam mark must be 0-100")
+    return student
+
+# Binary roster layout: a header, fixed-width records (code, four marks and the
+# position of the name in a trailing UTF-8 string table), then the string table
+BINARY_MAGIC = b"SMRB"
+BINARY_HEADER = struct.Struct('<4sHHI')  # magic, version, reserved, student count
+BINARY_RECORD = struct.Struct('<ihhhhIH2x')  # code, mark1-3, exam, name offset, name length
+if np is not None:
+    BINARY_DTYPE = np.dtype({
+        'names': ['student_code', 'mark1', 'mark2', 'mark3', 'exam_mark', 'name_offset', 'name_length'],
+        'formats': ['<i4', '<i2', '<i2', '<i2', '<i2', '<u4', '<u2'],
+        'offsets': [0, 4, 6, 8, 10, 12, 16],
+        'itemsize': BINARY_RECORD.size,
+    })
+
+def is_binary_roster(filename):
+    return filename.endswith('.bin')
+
+def write_binary_roster(filename, students):
+    names = bytearray()
+    records = bytearray()
+    for student in students:
+        name = student.name.encode('utf-8')
+        records += BINARY_RECORD.pack(student.student_code, student.mark1, student.mark2, student.mark3,
+                                      student.exam_mark, len(names), len(name))
+        names += name
+    with open(filename, 'wb') as f:
+        f.write(BINARY_HEADER.pack(BINARY_MAGIC, 1, 0, len(records) // BINARY_RECORD.size))
+        f.write(records)
+        f.write(names)
+        f.flush()
+        os.fsync(f.fileno())
+
+class BinaryRoster:
+    """Memory-mapped binary roster; with NumPy the record array is a zero-copy view of the file"""
     def __init__(self, filename):
-        self.filename = filename
-        self.students = []
-        self.load_data()
+        with open(filename, 'rb') as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self.buffer) < BINARY_HEADER.size:
+                raise ValueError(f"{filename} is not a binary student roster")
+            magic, version, reserved, self.count = BINARY_HEADER.unpack_from(self.buffer)
+            if magic != BINARY_MAGIC or version != 1:
+                raise ValueError(f"{filename} is not a binary student roster")
+            self.names_start = BINARY_HEADER.size + self.count * BINARY_RECORD.size
+            if len(self.buffer) < self.names_start:
+                raise ValueError(f"{filename} is truncated: expected {self.count} records")
+        except ValueError:
+            self.buffer.close()
+            raise
+        self.records = None
+        if np is not None:
+            self.records = np.frombuffer(self.buffer, dtype=BINARY_DTYPE, count=self.count,
+                                         offset=BINARY_HEADER.size)
     
-    def load_data(self):
-        """Load student data from file"""
-        if not os.path.exists(self.filename):
-            # Create sample data if file doesn't exist
-            sample_data = """5
+    def close(self):
+        """Unmap the file; column views from columns() must be dropped first"""
+        self.records = None
+        self.buffer.close()
+    
+    def iter_records(self):
+        """Yield (code, name, mark1, mark2, mark3, exam_mark) tuples"""
+        names = memoryview(self.buffer)[self.names_start:]
+        if self.records is not None:
+            r = self.records
+            rows = zip(r['student_code'].tolist(), r['mark1'].tolist(), r['mark2'].tolist(), r['mark3'].tolist(),
+                       r['exam_mark'].tolist(), r['name_offset'].tolist(), r['name_length'].tolist())
+        else:
+            rows = struct.iter_unpack(BINARY_RECORD.format,
+                                      memoryview(self.buffer)[BINARY_HEADER.size:self.names_start])
+        for code, mark1, mark2, mark3, exam_mark, offset, length in rows:
+            yield code, str(names[offset:offset + length], 'utf-8'), mark1, mark2, mark3, exam_mark
+    
+    def iter_chunks(self, chunk_size=10000, on_error=None, progress=None):
+        """Yield lists of validated Students, mirroring iter_student_chunks"""
+        suspect = None
+        if self.records is not None:
+            # Range-check the mark columns in one pass; only failing rows go through validate_student
+            r = self.records
+            coursework = np.stack([r['mark1'], r['mark2'], r['mark3']])
+            valid = ((coursework >= 0) & (coursework <= 20)).all(axis=0)
+            valid &= (r['exam_mark'] >= 0) & (r['exam_mark'] <= 100) & (r['name_length'] > 0)
+            suspect = set(np.flatnonzero(~valid).tolist())
+        
+        loaded = 0
+        chunk = []
+        for index, record in enumerate(self.iter_records()):
+            try:
+                student = Student(*record)
+                if suspect is None or index in suspect:
+                    validate_student(student)
+                chunk.append(student)
+            except ValueError as e:
+                if on_error:
+                    on_error(index + 1, ",".join(map(str, record)), str(e))
+                continue
+            if len(chunk) >= chunk_size:
+                loaded += len(chunk)
+                yield chunk
+                chunk = []
+                if progress:
+                    progress(loaded, self.count)
+        
+        loaded += len(chunk)
+        if chunk:
+            yield chunk
+        if progress:
+            progress(loaded, self.count)
+    
+    def columns(self, students):
+        """Build StudentColumns straight from the mapped record array"""
+        r = self.records
+        return StudentColumns(students, arrays=(r['student_code'], r['mark1'], r['mark2'], r['mark3'], r['exam_mark']))
+
+def format_student_line(student):
+    return f"{student.student_code},{student.name},{student.mark1},{student.mark2},{student.mark3},{student.exam_mark}"
+
+def iter_student_chunks(filename, chunk_size=10000, on_error=None, progress=None):
+    """Stream a marks file, yielding lists of at most chunk_size validated Students.
+    
+    Bad lines are passed to on_error(line_number, line, message) and skipped.
+    progress(loaded, expected) is called after each chunk, where expected is the
+    count from the header line (None if the header is unreadable).
+    """
+    with open(filename, 'r', encoding='utf-8') as f:
+        header = f.readline()
+        try:
+            expected = int(header.strip())
+        except ValueError:
+            expected = None
+            if on_error:
+                on_error(1, header.rstrip('\n'), "invalid student count header")
+        
+        loaded = 0
+        chunk = []
+        for line_number, line in enumerate(f, start=2):
+            if not line.strip():
+                continue
+            try:
+                chunk.append(parse_student_line(line))
+            except ValueError as e:
+                if on_error:
+                    on_error(line_number, line.rstrip('\n'), str(e))
+                continue
+            if len(chunk) >= chunk_size:
+                loaded += len(chunk)
+                yield chunk
+                chunk = []
+                if progress:
+                    progress(loaded, expected)
+        
+        loaded += len(chunk)
+        if chunk:
+            yield chunk
+        if progress:
+            progress(loaded, expected)
+
+class StudentColumns:
+    """Column arrays of the roster's marks with the derived scores computed in one vectorized pass"""
+    def __init__(self, students, arrays=None):
+        count = len(students)
+        self.rows = list(students)
+        if arrays is not None:
+            # Column arrays supplied by the caller, e.g. views over a mapped binary roster
+            self.student_code, self.mark1, self.mark2, self.mark3, self.exam_mark = arrays
+            self.compute_derived()
+            return
+        self.student_code = np.fromiter((s.student_code for s in self.rows), dtype=np.int32, count=count)
+        self.mark1 = np.fromiter((s.mark1 for s in self.rows), dtype=np.int16, count=count)
+        self.mark2 = np.fromiter((s.mark2 for s in self.rows), dtype=np.int16, count=count)
+        self.mark3 = np.fromiter((s.mark3 for s in self.rows), dtype=np.int16, count=count)
+        self.exam_mark = np.fromiter((s.exam_mark for s in self.rows), dtype=np.int16, count=count)
+        self.compute_derived()
+    
+    def compute_derived(self):
+        self.coursework_total = self.mark1 + self.mark2 + self.mark3
+        self.total_score = self.coursework_total + self.exam_mark
+        self.percentage = self.total_score / 160 * 100
+        # Index into GRADES: 0 for 'A' (70%+) down to 4 for 'F' (under 40%)
+        self.grade_index = 4 - np.digitize(self.percentage, [40, 50, 60, 70])
+    
+    def __len__(self):
+        return len(self.rows)
+
+SAMPLE_DATA = """5
 1001,John Smith,15,12,14,68
 1002,Emma Johnson,18,16,17,82
 1003,Michael Brown,8,10,9,45
 1004,Sarah Davis,16,15,14,72
 1005,David Wilson,12,11,13,58"""
-            with open(self.filename, 'w') as f:
-                f.write(sample_data)
-        
-        self.students = []
+
+def is_sqlite_roster(filename):
+    return filename.endswith(('.db', '.sqlite', '.sqlite3'))
+
+ROSTER_FORMATS = ['text', 'csv', 'bin', 'sqlite']
+
+def roster_format(filename):
+    """Guess a roster format from the file extension"""
+    if is_sqlite_roster(filename):
+        return 'sqlite'
+    if is_binary_roster(filename):
+        return 'bin'
+    if filename.endswith('.csv'):
+        return 'csv'
+    return 'text'
+
+CSV_HEADER = ['student_code', 'name', 'mark1', 'mark2', 'mark3', 'exam_mark',
+              'coursework_total', 'total_score', 'percentage', 'grade']
+
+def write_csv_roster(filename, students):
+    """Write students as CSV with a header row and the derived scores after the marks"""
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+        writer.writerows((s.student_code, s.name, s.mark1, s.mark2, s.mark3, s.exam_mark,
+                          s.coursework_total, s.total_score, f"{s.percentage:.2f}", s.grade) for s in students)
+        f.flush()
+        os.fsync(f.fileno())
+
+def iter_csv_students(filename, on_error=None):
+    """Stream validated Students from a CSV whose first six columns are code, name and the four marks.
+    
+    A header row is skipped and extra columns (such as those written by
+    write_csv_roster) are ignored; bad rows go to on_error(line_number, line, message).
+    """
+    with open(filename, 'r', newline='', encoding='utf-8') as f:
+        for line_number, row in enumerate(csv.reader(f), start=1):
+            if not row or not any(field.strip() for field in row):
+                continue
+            if line_number == 1 and not row[0].strip().isdigit():
+                continue
+            try:
+                if len(row) < 6:
+                    raise ValueError(f"expected at least 6 fields, found {len(row)}")
+                yield validate_student(Student(row[0], row[1].strip(), *row[2:6]))
+            except ValueError as e:
+                if on_error:
+                    on_error(line_number, ",".join(row), str(e))
+
+def write_roster_file(filename, students, format=None):
+    """Write a full roster to a temporary file and atomically swap it in.
+    
+    format is one of ROSTER_FORMATS and defaults to the one implied by the file name.
+    """
+    format = format or roster_format(filename)
+    if format not in ROSTER_FORMATS:
+        raise ValueError(f"unknown roster format {format!r}")
+    tmp_filename = filename + ".tmp"
+    if format == 'sqlite':
+        backend = SQLiteBackend(filename)
         try:
-            with open(self.filename, 'r') as f:
-                lines = f.readlines()
-                num_students = int(lines[0].strip())
-                
-                for line in lines[1:]:
-                    data = line.strip().split(',')
-                    if len(data) == 6:
-                        student = Student(data[0], data[1], data[2], data[3], data[4], data[5])
-                        self.students.append(student)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load data: {str(e)}")
+            backend.replace_all(students)
+        finally:
+            backend.close()
+        return
+    if format == 'bin':
+        write_binary_roster(tmp_filename, students)
+    elif format == 'csv':
+        write_csv_roster(tmp_filename, students)
+    else:
+        with open(tmp_filename, 'w', encoding='utf-8') as f:
+            f.write(f"{len(students)}\n")
+            for student in students:
+                f.write(format_student_line(student) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_filename, filename)
+
+class StorageBackend:
+    """Where a StudentManager's roster is kept.
+    
+    load() returns the students and raises if the store cannot be read at all;
+    record_change() is called (under the manager's lock) for each add ('A'),
+    update ('U') or delete ('D'); flush() persists any changes not yet written
+    and compact() rewrites the store in its canonical form.
+    """
+    def load(self, on_error=None, progress=None):
+        raise NotImplementedError
+    
+    def columns(self, students):
+        """Return a ready-made StudentColumns for freshly loaded students, or None"""
+        return None
+    
+    def record_change(self, op, student):
+        pass
+    
+    def record_bulk_add(self, students):
+        for student in students:
+            self.record_change('A', student)
+    
+    def flush(self, students):
+        raise NotImplementedError
+    
+    def compact(self, students):
+        pass
+    
+    def journal_size(self):
+        """Number of changes waiting to be folded back in by compact()"""
+        return 0
+    
+    def close(self):
+        pass
+
+class FileBackend(StorageBackend):
+    """studentMarks-style text, CSV or .bin roster, optionally with an append-only journal"""
+    def __init__(self, filename, journal=False, compact_every=1000):
+        self.filename = filename
+        # In journal mode edits are appended to a write-ahead log and folded
+        # back into the canonical file by compact()
+        self.journal = journal
+        self.journal_filename = filename + ".journal"
+        self.compact_every = compact_every
+        self._journal_entries = 0
+        self._journal_torn = False
+        self._pending = []
+        self._roster = None
+    
+    def load(self, on_error=None, progress=None):
+        if not os.path.exists(self.filename):
+            # Create sample data if file doesn't exist
+            write_roster_file(self.filename, [parse_student_line(line) for line in SAMPLE_DATA.splitlines()[1:]])
+        
+        errors = []
+        
+        def record_error(line_number, line, message):
+            errors.append(message)
+            if on_error:
+                on_error(line_number, line, message)
+        
+        # Bad records (and a bad count header) are skipped, but an unreadable
+        # file (invalid UTF-8, or a .bin with a bad magic number or truncated
+        # records) raises: carrying on with whatever was read would let the
+        # next save or compaction overwrite the file with it
+        by_code = {}
+        self.close()
+        if is_binary_roster(self.filename):
+            self._roster = BinaryRoster(self.filename)
+            chunks = self._roster.iter_chunks(on_error=record_error, progress=progress)
+        elif roster_format(self.filename) == 'csv':
+            # Read the way write_roster_file writes it, so a flush never rewrites a CSV misread as text
+            chunks = [list(iter_csv_students(self.filename, on_error=record_error))]
+            if progress:
+                progress(len(chunks[0]), None)
+        else:
+            chunks = iter_student_chunks(self.filename, on_error=record_error, progress=progress)
+        for chunk in chunks:
+            for student in chunk:
+                if student.student_code in by_code:
+                    record_error(None, student.name, f"duplicate student code {student.student_code}")
+                    continue
+                by_code[student.student_code] = student
+        
+        self._pending = []
+        self._journal_entries = 0
+        self._journal_torn = False
+        if self.journal and os.path.exists(self.journal_filename):
+            self._replay_journal(by_code, record_error)
+        if errors:
+            # Only an untouched mapping can double as the columnar view
+            self.close()
+        return list(by_code.values())
+    
+    def _replay_journal(self, by_code, record_error):
+        """Apply the write-ahead log on top of the canonical file's records"""
+        with open(self.journal_filename, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, start=1):
+                # Terminate a torn final line before the next append
+                self._journal_torn = not line.endswith('\n')
+                line = line.rstrip('\n')
+                if not line:
+                    continue
+                op, _, record = line.partition(',')
+                try:
+                    if op == 'D':
+                        by_code.pop(int(record), None)
+                    elif op in ('A', 'U'):
+                        # Adds and updates carry the full record, so replay is an upsert;
+                        # reassigning an existing key keeps the student's position
+                        student = parse_student_line(record)
+                        by_code[student.student_code] = student
+                    else:
+                        raise ValueError(f"unknown journal operation {op!r}")
+                except ValueError as e:
+                    # A torn final write from a crash shows up here and is skipped
+                    record_error(line_number, line, f"journal: {e}")
+                    continue
+                self._journal_entries += 1
+    
+    def columns(self, students):
+        # Reuse the mapped arrays as the columnar view when every record was loaded as stored
+        roster = self._roster
+        if roster is None or roster.records is None or self._journal_entries or len(students) != roster.count:
+            return None
+        return roster.columns(students)
+    
+    def close(self):
+        """Release the mapping of a .bin roster, which would block replacing the file on Windows"""
+        if self._roster is not None:
+            self._roster.close()
+            self._roster = None
+    
+    def record_change(self, op, student):
+        if not self.journal:
+            return
+        if op == 'D':
+            self._pending.append(f"D,{student.student_code}")
+        else:
+            self._pending.append(f"{op},{format_student_line(student)}")
+    
+    def flush(self, students):
+        if not self.journal:
+            self.close()
+            write_roster_file(self.filename, students)
+            return
+        if self._pending:
+            with open(self.journal_filename, 'a', encoding='utf-8') as f:
+                if self._journal_torn:
+                    f.write("\n")
+                    self._journal_torn = False
+                f.write("\n".join(self._pending) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._journal_entries += len(self._pending)
+            self._pending = []
+        if self._journal_entries >= self.compact_every:
+            self.compact(students)
+    
+    def journal_size(self):
+        return self._journal_entries + len(self._pending)
+    
+    def compact(self, students):
+        """Fold the journal back into the canonical file and truncate it"""
+        self._pending = []
+        self.close()
+        write_roster_file(self.filename, students)
+        if os.path.exists(self.journal_filename):
+            os.remove(self.journal_filename)
+        self._journal_entries = 0
+
+SQL_COLUMNS = "student_code, name, mark1, mark2, mark3, exam_mark"
+
+class SQLiteBackend(StorageBackend):
+    """Roster kept in a SQLite database; each edit is committed as its own transaction.
+    
+    The manager loads every row and answers lookups and aggregates from its
+    own in-memory indexes, so the table needs only its student_code primary
+    key: each edit is a single upsert or delete by code.
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS students (
+            student_code INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            mark1 INTEGER NOT NULL CHECK (mark1 BETWEEN 0 AND 20),
+            mark2 INTEGER NOT NULL CHECK (mark2 BETWEEN 0 AND 20),
+            mark3 INTEGER NOT NULL CHECK (mark3 BETWEEN 0 AND 20),
+            exam_mark INTEGER NOT NULL CHECK (exam_mark BETWEEN 0 AND 100)
+        );
+    """
+    
+    def __init__(self, filename):
+        self.filename = filename
+        # Saves may run on the background I/O thread; the manager's lock serializes access
+        self.connection = sqlite3.connect(filename, check_same_thread=False)
+        self.connection.executescript(self.SCHEMA)
+    
+    def close(self):
+        self.connection.close()
+    
+    def load(self, on_error=None, progress=None, chunk_size=10000):
+        expected = self.count()
+        students = []
+        cursor = self.connection.execute(f"SELECT {SQL_COLUMNS} FROM students ORDER BY rowid")
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            students.extend(Student(*row) for row in rows)
+            if progress:
+                progress(len(students), expected)
+        return students
+    
+    def _upsert(self, students):
+        self.connection.executemany(
+            f"INSERT OR REPLACE INTO students ({SQL_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)",
+            ((s.student_code, s.name, s.mark1, s.mark2, s.mark3, s.exam_mark) for s in students))
+    
+    def record_change(self, op, student):
+        with self.connection:
+            if op == 'D':
+                self.connection.execute("DELETE FROM students WHERE student_code = ?", (student.student_code,))
+            else:
+                self._upsert([student])
+    
+    def record_bulk_add(self, students):
+        with self.connection:
+            self._upsert(students)
+    
+    def flush(self, students):
+        # Every change is already committed by record_change
+        pass
+    
+    def replace_all(self, students):
+        """Replace the table's contents with students in a single transaction"""
+        with self.connection:
+            self.connection.execute("DELETE FROM students")
+            self._upsert(students)
+    
+    def count(self):
+        return self.connection.execute("SELECT COUNT(*) FROM students").fetchone()[0]
+
+def open_backend(filename, journal=False, compact_every=1000):
+    """Pick a storage backend from the file name: SQLite for .db/.sqlite, files otherwise"""
+    if is_sqlite_roster(filename):
+        return SQLiteBackend(filename)
+    return FileBackend(filename, journal=journal, compact_every=compact_every)
+
+def convert_roster(source, destination):
+    """Convert a roster between the formats in ROSTER_FORMATS, chosen by file extension"""
+    manager = StudentManager(source)
+    try:
+        manager.export(destination)
+    finally:
+        manager.close()
+    return manager.load_errors
+
+def name_trigrams(name):
+    """Return the set of three-letter substrings of each word of name, padded as "  word " """
+    trigrams = set()
+    for word in name.casefold().split():
+        padded = f"  {word} "
+        trigrams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+def build_trigram_index(names):
+    """Map each trigram to the set of codes whose name contains it, from (code, name) pairs"""
+    index = {}
+    for code, name in names:
+        for trigram in name_trigrams(name):
+            index.setdefault(trigram, set()).add(code)
+    return index
+
+# Sorts after every other character, so (prefix + PREFIX_SENTINEL,) bounds all names starting with prefix
+PREFIX_SENTINEL = chr(0x10FFFF)
+
+class NamePrefixMatches:
+    """Read-only sequence over a slice of the manager's sorted name keys, valid until the roster changes"""
+    def __init__(self, name_keys, by_code, start, stop):
+        self._name_keys = name_keys
+        self._by_code = by_code
+        self._start = start
+        self._stop = stop
+    
+    def __len__(self):
+        return self._stop - self._start
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("match index out of range")
+        return self._by_code[self._name_keys[self._start + index][1]]
+
+class StudentManager:
+    def __init__(self, filename, progress=None, journal=False, compact_every=1000, backend=None):
+        self.filename = filename
+        self.backend = backend or open_backend(filename, journal=journal, compact_every=compact_every)
+        self.students = []
+        self.load_errors = []
+        self.save_error = None
+        # Guards the roster and the backend against background saves
+        self.lock = threading.RLock()
+        # Lookup indexes kept in step with self.students
+        self._by_code = {}
+        self._by_name = {}
+        self._name_keys = []
+        self._name_keys_sorted = True
+        self._columns = None
+        # True while _columns (and sort keys built from it) are views of a mapped .bin file
+        self._views_mapped = False
+        self._sort_keys = {}
+        self._sort_views = {}
+        self._total_sum = 0
+        self._by_grade = {grade: set() for grade in GRADES}
+        self._by_total = {}
+        self._mark_counts = {field: [0] * (maximum + 1) for field, maximum in MARK_MAXIMUMS.items()}
+        self._min_heap = []
+        self._max_heap = []
+        # Trigram -> student codes for fuzzy_search; built on first use, then kept in step
+        self._by_trigram = None
+        # Bumped on every change to the indexes, so work done outside the lock can tell it is stale
+        self._generation = 0
+        # Callbacks notified of every change to the roster; see subscribe
+        self._subscribers = []
+        self.load_data(progress)
+    
+    def load_data(self, progress=None):
+        """Load student data from the backend, recording bad lines in self.load_errors"""
+        self.load_errors = []
+        
+        def record_error(line_number, line, message):
+            self.load_errors.append((line_number, line, message))
+        
+        with self.lock:
+            # Drop views over the old mapping so the backend can unmap it
+            self._invalidate_views()
+            self.students = self.backend.load(on_error=record_error, progress=progress)
+            self._rebuild_indexes()
+            columns = self.backend.columns(self.students)
+            if columns is not None:
+                self._columns = columns
+                self._views_mapped = True
+            self._notify('L', self.students)
+    
+    def _log_change(self, op, student):
+        self.backend.record_change(op, student)
+    
+    def subscribe(self, callback):
+        """Call callback(op, students) after every change to the roster.
+        
+        op is 'A' (added), 'U' (updated), 'D' (deleted) or 'L' (reloaded) and
+        students lists the affected records. Callbacks run on the thread that made
+        the change, with the manager's lock held.
+        """
+        self._subscribers.append(callback)
+    
+    def unsubscribe(self, callback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+    
+    def _notify(self, op, students):
+        for callback in list(self._subscribers):
+            callback(op, students)
+    
+    def _rebuild_indexes(self):
+        """Rebuild the code and name indexes from self.students"""
+        self._invalidate_views()
+        self._generation += 1
+        self._by_code = {}
+        self._by_name = {}
+        for student in self.students:
+            self._by_code.setdefault(student.student_code, student)
+            self._by_name.setdefault(student.name.casefold(), []).append(student)
+        self._name_keys = sorted((s.name.casefold(), s.student_code) for s in self._by_code.values())
+        self._name_keys_sorted = True
+        
+        # Running aggregates for the dashboard and sidebar
+        self._total_sum = sum(s.total_score for s in self.students)
+        # Grade and total-score (0-160) buckets of student codes; bucket sizes give the histogram
+        self._by_grade = {grade: set() for grade in GRADES}
+        self._by_total = {}
+        for student in self.students:
+            self._by_grade[student.grade].add(student.student_code)
+            self._by_total.setdefault(student.total_score, set()).add(student.student_code)
+        # Students per mark value for each component in MARK_MAXIMUMS
+        self._mark_counts = {}
+        for field, maximum in MARK_MAXIMUMS.items():
+            counts = Counter(map(attrgetter(field), self.students))
+            self._mark_counts[field] = [counts.get(value, 0) for value in range(maximum + 1)]
+        # Min/max heaps of (total, code); entries for deleted or re-marked students
+        # are left in place and discarded lazily when they reach the top
+        self._min_heap = [(s.total_score, s.student_code) for s in self.students]
+        self._max_heap = [(-s.total_score, s.student_code) for s in self.students]
+        heapq.heapify(self._min_heap)
+        heapq.heapify(self._max_heap)
+        self._by_trigram = None
+    
+    def _index_student(self, student):
+        self._invalidate_views()
+        self._generation += 1
+        self._by_code[student.student_code] = student
+        self._by_name.setdefault(student.name.casefold(), []).append(student)
+        # Appends are sorted lazily; Timsort merges the sorted run and the new tail cheaply
+        self._name_keys.append((student.name.casefold(), student.student_code))
+        self._name_keys_sorted = False
+        self._total_sum += student.total_score
+        self._by_grade[student.grade].add(student.student_code)
+        self._by_total.setdefault(student.total_score, set()).add(student.student_code)
+        for field, counts in self._mark_counts.items():
+            counts[getattr(student, field)] += 1
+        heapq.heappush(self._min_heap, (student.total_score, student.student_code))
+        heapq.heappush(self._max_heap, (-student.total_score, student.student_code))
+        if self._by_trigram is not None:
+            for trigram in name_trigrams(student.name):
+                self._by_trigram.setdefault(trigram, set()).add(student.student_code)
+        self._compact_heaps()
+    
+    def _unindex_student(self, student):
+        self._invalidate_views()
+        self._generation += 1
+        self._by_code.pop(student.student_code, None)
+        key = student.name.casefold()
+        matches = self._by_name.get(key, [])
+        if student in matches:
+            matches.remove(student)
+            if not matches:
+                del self._by_name[key]
+        name_keys = self._sorted_name_keys()
+        i = bisect_left(name_keys, (key, student.student_code))
+        if i < len(name_keys) and name_keys[i] == (key, student.student_code):
+            del name_keys[i]
+        self._total_sum -= student.total_score
+        self._by_grade[student.grade].discard(student.student_code)
+        self._by_total.get(student.total_score, set()).discard(student.student_code)
+        for field, counts in self._mark_counts.items():
+            counts[getattr(student, field)] -= 1
+        if self._by_trigram is not None:
+            for trigram in name_trigrams(student.name):
+                codes = self._by_trigram.get(trigram)
+                if codes is not None:
+                    codes.discard(student.student_code)
+                    if not codes:
+                        del self._by_trigram[trigram]
+        self._compact_heaps()
+    
+    def _compact_heaps(self):
+        """Drop stale heap entries once they outnumber live ones, so the heaps stay O(n)"""
+        if len(self._min_heap) <= 2 * len(self._by_code) + 64:
+            return
+        self._min_heap = [(s.total_score, code) for code, s in self._by_code.items()]
+        self._max_heap = [(-s.total_score, code) for code, s in self._by_code.items()]
+        heapq.heapify(self._min_heap)
+        heapq.heapify(self._max_heap)
+    
+    def _heap_top(self, heap, sign):
+        """Return the student at the top of a min/max heap, dropping stale entries"""
+        while heap:
+            total, code = heap[0]
+            student = self._by_code.get(code)
+            if student is not None and student.total_score == sign * total:
+                return student
+            heapq.heappop(heap)
+        return None
+    
+    def _sorted_name_keys(self):
+        if not self._name_keys_sorted:
+            self._name_keys.sort()
+            self._name_keys_sorted = True
+        return self._name_keys
     
     def save_data(self):
-        """Save student data to file"""
+        """Save student data to file, or append pending edits to the journal in journal mode.
+        
+        Returns False and keeps the exception in self.save_error if the write fails.
+        """
         try:
-            with open(self.filename, 'w') as f:
-                f.write(f"{len(self.students)}\n")
-                for student in self.students:
-                    f.write(f"{student.student_code},{student.name},{student.mark1},{student.mark2},{student.mark3},{student.exam_mark}\n")
+            self.write_data()
+            self.save_error = None
             return True
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to save data: {str(e)}")
+            self.save_error = e
             return False
     
+    def write_data(self):
+        """Persist the roster like save_data, raising on failure (safe to call from a worker thread)"""
+        with self.lock:
+            if self._views_mapped:
+                # A non-journaled flush rewrites the mapped file
+                self._invalidate_views()
+            self.backend.flush(self.students)
+    
+    def export(self, filename, format=None):
+        """Write the roster to filename in one of ROSTER_FORMATS (default: from the extension)"""
+        with self.lock:
+            write_roster_file(filename, self.students, format)
+    
+    def compact(self):
+        """Rewrite the backing store in its canonical form, folding in any journal"""
+        with self.lock:
+            self._invalidate_views()
+            self.backend.compact(self.students)
+    
+    def close(self):
+        """Release the backend's file handles, mappings or connections"""
+        with self.lock:
+            self._invalidate_views()
+            self.backend.close()
+    
     def get_all_students(self):
         return self.students
     
     def get_student_by_code(self, code):
-        for student in self.students:
-            if student.student_code == code:
-                return student
-        return None
+        return self._by_code.get(code)
     
     def get_student_by_name(self, name):
-        for student in self.students:
-            if student.name.lower() == name.lower():
-                return student
-        return None
+        matches = self._by_name.get(name.casefold())
+        return matches[0] if matches else None
     
-    def get_highest_scoring_student(self):
-        if not self.students:
+    def match_name_prefix(self, prefix):
+        """Return a lazy NamePrefixMatches over students whose name starts with prefix, in name order.
+        
+        Two bisections bound the match range, so the cost does not grow with the
+        number of matches; rows are only built as they are read.
+        """
+        name_keys, start, stop = self._name_prefix_range(prefix.casefold())
+        return NamePrefixMatches(name_keys, self._by_code, start, stop)
+    
+    def _name_prefix_range(self, prefix):
+        """Return (sorted name keys, start, stop) bounding the keys that start with a casefolded prefix"""
+        name_keys = self._sorted_name_keys()
+        start = bisect_left(name_keys, (prefix,))
+        stop = bisect_left(name_keys, (prefix + PREFIX_SENTINEL,), start)
+        return name_keys, start, stop
+    
+    def fuzzy_search(self, name, limit=10, min_similarity=0.3):
+        """Return up to limit students whose names are similar to name, best match first.
+        
+        Similarity is the Dice coefficient of the names' trigram sets. Candidates are
+        gathered from the trigram index, skipping trigrams too common to narrow
+        the search, so only a small part of the roster is scored exactly.
+        """
+        query = name_trigrams(name)
+        if not query:
+            return []
+        with self.lock:
+            index = self._trigram_index()
+            postings = sorted((index.get(trigram, ()) for trigram in query), key=len)
+            common = max(1000, len(self._by_code) // 20)
+            selective = [codes for codes in postings if 0 < len(codes) <= common]
+            hits = {}
+            for codes in selective or postings:
+                for code in codes:
+                    hits[code] = hits.get(code, 0) + 1
+            
+            scored = []
+            for code in heapq.nlargest(limit * 10, hits, key=hits.get):
+                student = self._by_code[code]
+                trigrams = name_trigrams(student.name)
+                shared = len(query & trigrams)
+                similarity = 2 * shared / (len(query) + len(trigrams))
+                if similarity >= min_similarity:
+                    scored.append((similarity, student))
+        scored.sort(key=lambda pair: pair[0], reverse=True)
+        return [student for similarity, student in scored[:limit]]
+    
+    def build_fuzzy_index(self):
+        """Build the trigram index now (e.g. on a worker thread) instead of on the first fuzzy_search.
+        
+        The index is built from a snapshot without holding the lock, and only
+        installed if the roster has not changed in the meantime.
+        """
+        with self.lock:
+            if self._by_trigram is not None:
+                return
+            generation = self._generation
+            names = [(code, student.name) for code, student in self._by_code.items()]
+        index = build_trigram_index(names)
+        with self.lock:
+            if self._by_trigram is None and self._generation == generation:
+                self._by_trigram = index
+    
+    def _trigram_index(self):
+        if self._by_trigram is None:
+            self._by_trigram = build_trigram_index(
+                (code, student.name) for code, student in self._by_code.items())
+        return self._by_trigram
+    
+    def _invalidate_views(self):
+        """Drop the columnar view and cached sort orders after the roster changes"""
+        self._columns = None
+        self._views_mapped = False
+        self._sort_keys = {}
+        self._sort_views = {}
+    
+    def get_columns(self):
+        """Return the columnar view of the roster, or None when NumPy is unavailable"""
+        if np is None:
             return None
-        return max(self.students, key=lambda x: x.total_score)
+        if self._columns is None or len(self._columns) != len(self.students):
+            self._columns = StudentColumns(self.students)
+        return self._columns
+    
+    def get_highest_scoring_student(self):
+        return self._heap_top(self._max_heap, -1)
     
     def get_lowest_scoring_student(self):
+        return self._heap_top(self._min_heap, 1)
+    
+    def get_average_percentage(self):
         if not self.students:
-            return None
-        return min(self.students, key=lambda x: x.total_score)
+            return 0
+        return (self._total_sum / len(self.students)) / 160 * 100
+    
+    def get_grade_distribution(self):
+        return {grade: len(codes) for grade, codes in self._by_grade.items()}
+    
+    def get_score_histogram(self):
+        """Return a list of student counts for each total score from 0 to 160"""
+        histogram = [0] * 161
+        for total, codes in self._by_total.items():
+            histogram[total] = len(codes)
+        return histogram
+    
+    def get_mark_histogram(self, field):
+        """Return a list of student counts for each value (0 to its maximum) of a MARK_MAXIMUMS field"""
+        return list(self._mark_counts[field])
+    
+    def _sort_key(self, field):
+        """Return the precomputed sort key for a field, one entry per student"""
+        key = self._sort_keys.get(field)
+        if key is None:
+            attribute, column = SORT_FIELDS[field]
+            columns = self.get_columns()
+            if columns is None:
+                key = [getattr(s, attribute) for s in self.students]
+            elif column is not None:
+                key = getattr(columns, column)
+            else:
+                # Dense ranks let text keys be negated and lexsorted like numbers
+                values = np.array([getattr(s, attribute) for s in columns.rows])
+                key = np.unique(values, return_inverse=True)[1].reshape(-1)
+            self._sort_keys[field] = key
+        return key
+    
+    def sorted_view(self, ordering):
+        """Return the students ordered by [(field, descending), ...] without touching self.students.
+        
+        Earlier fields take priority and ties keep roster order. Views are cached
+        per ordering until the roster changes.
+        """
+        ordering = tuple((field, bool(descending)) for field, descending in ordering)
+        view = self._sort_views.get(ordering)
+        if view is not None:
+            return view
+        
+        columns = self.get_columns()
+        if columns is not None:
+            # np.lexsort treats its last key as the primary one
+            keys = [-self._sort_key(field) if descending else self._sort_key(field)
+                    for field, descending in reversed(ordering)]
+            order = np.lexsort(keys) if keys else range(len(columns))
+            rows = columns.rows
+            view = [rows[i] for i in order]
+        else:
+            # Stable sorts applied from the least to the most significant key
+            order = list(range(len(self.students)))
+            for field, descending in reversed(ordering):
+                order.sort(key=self._sort_key(field).__getitem__, reverse=descending)
+            view = [self.students[i] for i in order]
+        
+        self._sort_views[ordering] = view
+        return view
+    
+    def query(self, codes=None, grades=None, min_percentage=None, max_percentage=None,
+              min_exam=None, max_exam=None, name_prefix=None):
+        """Return the students matching every given filter, ordered by student code.
+        
+        The most selective indexed filter (codes, name prefix, grades or the
+        percentage range) supplies the candidates; the rest are checked per student.
+        """
+        predicates = []
+        candidates = []
+        
+        if codes is not None:
+            codes = {int(code) for code in codes}
+            candidates.append((len(codes), lambda: codes))
+            predicates.append(lambda s: s.student_code in codes)
+        
+        if name_prefix:
+            prefix = name_prefix.casefold()
+            name_keys, start, end = self._name_prefix_range(prefix)
+            candidates.append((end - start, lambda: {code for name, code in name_keys[start:end]}))
+            predicates.append(lambda s: s.name.casefold().startswith(prefix))
+        
+        if grades is not None:
+            grades = set(grades)
+            candidates.append((sum(len(self._by_grade.get(g, ())) for g in grades),
+                               lambda: set().union(*(self._by_grade.get(g, ()) for g in grades))))
+            predicates.append(lambda s: s.grade in grades)
+        
+        if min_percentage is not None or max_percentage is not None:
+            low = -1 if min_percentage is None else min_percentage
+            high = 101 if max_percentage is None else max_percentage
+            # Percentage is a function of total score, so scan at most 161 buckets
+            totals = [total for total in self._by_total if low <= (total / 160) * 100 <= high]
+            candidates.append((sum(len(self._by_total[t]) for t in totals),
+                               lambda: set().union(*(self._by_total[t] for t in totals))))
+            predicates.append(lambda s: low <= s.percentage <= high)
+        
+        if min_exam is not None:
+            predicates.append(lambda s: s.exam_mark >= min_exam)
+        if max_exam is not None:
+            predicates.append(lambda s: s.exam_mark <= max_exam)
+        
+        if candidates:
+            size, lookup = min(candidates, key=lambda c: c[0])
+            pool = (self._by_code[code] for code in sorted(lookup()) if code in self._by_code)
+        else:
+            pool = sorted(self.students, key=attrgetter('student_code'))
+        return [s for s in pool if all(predicate(s) for predicate in predicates)]
+    
+    def top_k(self, n, key='total_score'):
+        """Return the n highest students by key (an attribute name or callable), best first"""
+        if isinstance(key, str):
+            key = attrgetter(key)
+        return heapq.nlargest(n, self.students, key=key)
+    
+    def bottom_k(self, n, key='total_score'):
+        """Return the n lowest students by key (an attribute name or callable), lowest first"""
+        if isinstance(key, str):
+            key = attrgetter(key)
+        return heapq.nsmallest(n, self.students, key=key)
     
     def add_student(self, student_code, name, mark1, mark2, mark3, exam_mark):
         # Check if student code already exists
@@ -113,16 +1144,64 @@ class StudentManager:
             return False, "Student code already exists"
         
         try:
-            student = Student(student_code, name, mark1, mark2, mark3, exam_mark)
-            self.students.append(student)
+            # Checked like loaded records, so everything accepted here survives a reload
+            student = validate_student(Student(student_code, name, mark1, mark2, mark3, exam_mark))
+            if student.student_code in self._by_code:
+                return False, "Student code already exists"
+            with self.lock:
+                # The backend write comes first, so a failed write leaves the roster untouched
+                self._log_change('A', student)
+                self.students.append(student)
+                self._index_student(student)
+                self._notify('A', [student])
             return True, "Student added successfully"
         except Exception as e:
             return False, f"Error adding student: {str(e)}"
     
+    def bulk_add(self, records):
+        """Add many students at once; records are Students or (code, name, mark1, mark2, mark3, exam) rows.
+        
+        Marks are validated like the add dialog (coursework 0-20, exam 0-100) and
+        duplicate codes are caught with a set. Valid records are added and logged in
+        one batch; returns (added_count, [(index, record, message), ...]).
+        """
+        errors = []
+        batch = []
+        seen = set(self._by_code)
+        for index, record in enumerate(records):
+            try:
+                student = record if isinstance(record, Student) else Student(*record)
+                validate_student(student)
+            except (TypeError, ValueError) as e:
+                errors.append((index, record, str(e)))
+                continue
+            if student.student_code in seen:
+                errors.append((index, record, f"duplicate student code {student.student_code}"))
+                continue
+            seen.add(student.student_code)
+            batch.append(student)
+        
+        with self.lock:
+            self.backend.record_bulk_add(batch)
+            for student in batch:
+                # Append one at a time so self.students never holds unindexed students
+                self.students.append(student)
+                self._index_student(student)
+            if batch:
+                self._notify('A', batch)
+        return len(batch), errors
+    
     def delete_student(self, student_code):
         student = self.get_student_by_code(student_code)
         if student:
-            self.students.remove(student)
+            with self.lock:
+                try:
+                    self._log_change('D', student)
+                except Exception as e:
+                    return False, f"Error deleting student: {str(e)}"
+                self.students.remove(student)
+                self._unindex_student(student)
+                self._notify('D', [student])
             return True, "Student deleted successfully"
         return False, "Student not found"
     
@@ -131,729 +1210,168 @@ class StudentManager:
         if not student:
             return False, "Student not found"
         
+        unknown = [key for key in kwargs if key not in EDITABLE_FIELDS]
+        if unknown:
+            return False, f"Error updating student: cannot update {', '.join(unknown)}"
+        
         try:
-            for key, value in kwargs.items():
-                if hasattr(student, key):
-                    setattr(student, key, value)
-            return True, "Student updated successfully"
-        except Exception as e:
+            # Validate and persist an updated copy first, so a rejected value or a
+            # failed backend write leaves the student and the indexes untouched
+            values = {field: getattr(student, field) for field in EDITABLE_FIELDS}
+            values.update(kwargs)
+            updated = validate_student(Student(student.student_code, **values))
+        except (TypeError, ValueError) as e:
             return False, f"Error updating student: {str(e)}"
-
-class ModernStudentManagerApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Student Manager")
-        self.root.geometry("1200x800")
-        self.root.configure(bg='#f8fafc')
-        
-        # Initialize student manager
-        self.manager = StudentManager("studentMarks.txt")
-        
-        # Colors
-        self.colors = {
-            'primary': '#3b82f6',
-            'secondary': '#64748b',
-            'success': '#10b981',
-            'warning': '#f59e0b',
-            'danger': '#ef4444',
-            'light': '#f8fafc',
-            'dark': '#1e293b',
-            'sidebar': '#1e293b',
-            'header': '#334155'
-        }
-        
-        self.setup_gui()
-    
-    def setup_gui(self):
-        # Create main container
-        main_container = tk.Frame(self.root, bg=self.colors['light'])
-        main_container.pack(fill=tk.BOTH, expand=True)
-        
-        # Sidebar
-        self.create_sidebar(main_container)
-        
-        # Main content area
-        self.create_main_content(main_container)
-    
-    def create_sidebar(self, parent):
-        sidebar = tk.Frame(parent, bg=self.colors['sidebar'], width=250)
-        sidebar.pack(side=tk.LEFT, fill=tk.Y)
-        sidebar.pack_propagate(False)
-        
-        # Logo/Title
-        title_frame = tk.Frame(sidebar, bg=self.colors['sidebar'])
-        title_frame.pack(fill=tk.X, pady=20, padx=15)
-        
-        tk.Label(title_frame, text="STUDENT MANAGER", font=("Arial", 16, "bold"), 
-                bg=self.colors['sidebar'], fg="white").pack(anchor=tk.W)
-        
-        # Navigation menu
-        nav_frame = tk.Frame(sidebar, bg=self.colors['sidebar'])
-        nav_frame.pack(fill=tk.X, padx=15, pady=20)
-        
-        # Main navigation sections
-        main_nav_items = [
-            ("📊 Dashboard", self.show_dashboard),
-            ("👥 All Students", self.view_all_students),
-            ("🔍 Find Student", self.view_individual_student)
-        ]
-        
-        tk.Label(nav_frame, text="MAIN NAVIGATION", font=("Arial", 10, "bold"),
-                bg=self.colors['sidebar'], fg="#94a3b8").pack(anchor=tk.W, pady=(0, 10))
-        
-        for text, command in main_nav_items:
-            btn = tk.Button(nav_frame, text=text, font=("Arial", 11), 
-                          bg=self.colors['sidebar'], fg="#cbd5e1", bd=0,
-                          anchor=tk.W, justify=tk.LEFT,
-                          command=command)
-            btn.pack(fill=tk.X, pady=3)
-            btn.bind("<Enter>", lambda e, b=btn: b.config(bg=self.colors['primary'], fg="white"))
-            btn.bind("<Leave>", lambda e, b=btn: b.config(bg=self.colors['sidebar'], fg="#cbd5e1"))
-        
-        # Analytics section
-        tk.Label(nav_frame, text="ANALYTICS", font=("Arial", 10, "bold"),
-                bg=self.colors['sidebar'], fg="#94a3b8").pack(anchor=tk.W, pady=(20, 10))
-        
-        analytics_items = [
-            ("🏆 Top Performers", self.show_highest_student),
-            ("📉 Lowest Scores", self.show_lowest_student),
-            ("📊 Sort & Filter", self.sort_students)
-        ]
-        
-        for text, command in analytics_items:
-            btn = tk.Button(nav_frame, text=text, font=("Arial", 11), 
-                          bg=self.colors['sidebar'], fg="#cbd5e1", bd=0,
-                          anchor=tk.W, justify=tk.LEFT,
-                          command=command)
-            btn.pack(fill=tk.X, pady=3)
-            btn.bind("<Enter>", lambda e, b=btn: b.config(bg=self.colors['primary'], fg="white"))
-            btn.bind("<Leave>", lambda e, b=btn: b.config(bg=self.colors['sidebar'], fg="#cbd5e1"))
-        
-        # Management section
-        tk.Label(nav_frame, text="MANAGEMENT", font=("Arial", 10, "bold"),
-                bg=self.colors['sidebar'], fg="#94a3b8").pack(anchor=tk.W, pady=(20, 10))
-        
-        management_items = [
-            ("➕ Add Student", self.add_student),
-            ("✏️ Edit Records", self.update_student),
-            ("🗑️ Delete Student", self.delete_student)
-        ]
-        
-        for text, command in management_items:
-            btn = tk.Button(nav_frame, text=text, font=("Arial", 11), 
-                          bg=self.colors['sidebar'], fg="#cbd5e1", bd=0,
-                          anchor=tk.W, justify=tk.LEFT,
-                          command=command)
-            btn.pack(fill=tk.X, pady=3)
-            btn.bind("<Enter>", lambda e, b=btn: b.config(bg=self.colors['primary'], fg="white"))
-            btn.bind("<Leave>", lambda e, b=btn: b.config(bg=self.colors['sidebar'], fg="#cbd5e1"))
-        
-        # Progress section
-        progress_frame = tk.Frame(sidebar, bg=self.colors['sidebar'])
-        progress_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=15, pady=20)
-        
-        tk.Label(progress_frame, text="YOUR PROGRESS", font=("Arial", 10, "bold"),
-                bg=self.colors['sidebar'], fg="#94a3b8").pack(anchor=tk.W)
-        
-        tk.Label(progress_frame, text=f"{len(self.manager.students)} Students Managed", 
-                font=("Arial", 10), bg=self.colors['sidebar'], fg="#cbd5e1").pack(anchor=tk.W, pady=(5, 0))
-        
-        # Calculate average grade distribution
-        grade_count = {'A': 0, 'B': 0, 'C': 0, 'D': 0, 'F': 0}
-        for student in self.manager.students:
-            grade_count[student.grade] += 1
-        
-        grade_text = " | ".join([f"{grade}:{count}" for grade, count in grade_count.items() if count > 0])
-        tk.Label(progress_frame, text=f"Grades: {grade_text}", 
-                font=("Arial", 9), bg=self.colors['sidebar'], fg="#94a3b8").pack(anchor=tk.W, pady=(2, 10))
-        
-        # Sign out button
-        signout_btn = tk.Button(sidebar, text="🚪 Sign Out", font=("Arial", 11),
-                               bg=self.colors['sidebar'], fg="#cbd5e1", bd=0,
-                               command=self.root.quit)
-        signout_btn.pack(side=tk.BOTTOM, fill=tk.X, padx=15, pady=10)
-        signout_btn.bind("<Enter>", lambda e: signout_btn.config(bg=self.colors['danger'], fg="white"))
-        signout_btn.bind("<Leave>", lambda e: signout_btn.config(bg=self.colors['sidebar'], fg="#cbd5e1"))
-    
-    def create_main_content(self, parent):
-        main_content = tk.Frame(parent, bg=self.colors['light'])
-        main_content.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
-        
-        # Header
-        header = tk.Frame(main_content, bg="white", height=80)
-        header.pack(fill=tk.X)
-        header.pack_propagate(False)
-        
-        tk.Label(header, text="Student Analytics Dashboard", font=("Arial", 20, "bold"),
-                bg="white", fg=self.colors['dark']).pack(side=tk.LEFT, padx=30, pady=20)
-        
-        # Content area
-        self.content_frame = tk.Frame(main_content, bg=self.colors['light'])
-        self.content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        # Show dashboard by default
-        self.show_dashboard()
-    
-    def clear_content(self):
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-    
-    def create_card(self, parent, title, value, color, width=200):
-        card = tk.Frame(parent, bg="white", relief=tk.RAISED, bd=1)
-        card.pack(side=tk.LEFT, padx=10, pady=10)
-        
-        tk.Label(card, text=title, font=("Arial", 12), 
-                bg="white", fg=self.colors['secondary']).pack(pady=(15, 5))
-        
-        tk.Label(card, text=value, font=("Arial", 24, "bold"), 
-                bg="white", fg=color).pack(pady=5)
-        
-        return card
-    
-    def show_dashboard(self):
-        self.clear_content()
-        
-        # Welcome section
-        welcome_frame = tk.Frame(self.content_frame, bg=self.colors['light'])
-        welcome_frame.pack(fill=tk.X, pady=10)
-        
-        tk.Label(welcome_frame, text="Welcome to Student Manager", 
-                font=("Arial", 16, "bold"), bg=self.colors['light'], 
-                fg=self.colors['dark']).pack(anchor=tk.W)
-        
-        tk.Label(welcome_frame, text="Manage and analyze student performance data", 
-                font=("Arial", 12), bg=self.colors['light'], 
-                fg=self.colors['secondary']).pack(anchor=tk.W, pady=(5, 20))
-        
-        # Stats cards
-        stats_frame = tk.Frame(self.content_frame, bg=self.colors['light'])
-        stats_frame.pack(fill=tk.X, pady=10)
-        
-        total_students = len(self.manager.students)
-        avg_percentage = sum(s.percentage for s in self.manager.students) / total_students if total_students > 0 else 0
-        highest_student = self.manager.get_highest_scoring_student()
-        lowest_student = self.manager.get_lowest_scoring_student()
-        
-        self.create_card(stats_frame, "Total Students", total_students, self.colors['primary'])
-        self.create_card(stats_frame, "Average %", f"{avg_percentage:.1f}%", self.colors['success'])
-        self.create_card(stats_frame, "Highest Score", f"{highest_student.percentage:.1f}%" if highest_student else "N/A", self.colors['warning'])
-        self.create_card(stats_frame, "Lowest Score", f"{lowest_student.percentage:.1f}%" if lowest_student else "N/A", self.colors['danger'])
-        
-        # Grade distribution card
-        grade_frame = tk.Frame(self.content_frame, bg=self.colors['light'])
-        grade_frame.pack(fill=tk.X, pady=10)
-        
-        grade_card = tk.Frame(grade_frame, bg="white", relief=tk.RAISED, bd=1)
-        grade_card.pack(side=tk.LEFT, padx=10, pady=10)
-        
-        tk.Label(grade_card, text="Grade Distribution", font=("Arial", 12), 
-                bg="white", fg=self.colors['secondary']).pack(pady=(15, 10))
-        
-        grade_count = {'A': 0, 'B': 0, 'C': 0, 'D': 0, 'F': 0}
-        for student in self.manager.students:
-            grade_count[student.grade] += 1
-        
-        for grade in ['A', 'B', 'C', 'D', 'F']:
-            grade_row = tk.Frame(grade_card, bg="white")
-            grade_row.pack(fill=tk.X, padx=10, pady=2)
-            tk.Label(grade_row, text=grade, font=("Arial", 10, "bold"), 
-                    bg="white", fg=self.get_grade_color(grade), width=3).pack(side=tk.LEFT)
-            tk.Label(grade_row, text=f"{grade_count[grade]} students", font=("Arial", 10),
-                    bg="white", fg=self.colors['dark']).pack(side=tk.LEFT, padx=10)
-        
-        # Recent students table
-        table_frame = tk.Frame(self.content_frame, bg=self.colors['light'])
-        table_frame.pack(fill=tk.BOTH, expand=True, pady=20)
-        
-        tk.Label(table_frame, text="Recent Student Records", font=("Arial", 14, "bold"),
-                bg=self.colors['light'], fg=self.colors['dark']).pack(anchor=tk.W)
-        
-        # Create table
-        self.create_students_table(table_frame, self.manager.students[:10])  # Show first 10 students
-    
-    def create_students_table(self, parent, students):
-        table_container = tk.Frame(parent, bg="white", relief=tk.SUNKEN, bd=1)
-        table_container.pack(fill=tk.BOTH, expand=True, pady=10)
-        
-        # Table header
-        header_frame = tk.Frame(table_container, bg=self.colors['header'])
-        header_frame.pack(fill=tk.X)
-        
-        headers = ["Student Name", "Student Code", "Coursework", "Exam", "Total %", "Grade"]
-        widths = [25, 12, 12, 8, 10, 8]  # Character widths for proper alignment
-        
-        for i, (header, width) in enumerate(zip(headers, widths)):
-            tk.Label(header_frame, text=header, font=("Arial", 10, "bold"),
-                    bg=self.colors['header'], fg="white", width=width, anchor=tk.CENTER).grid(
-                    row=0, column=i, padx=1, pady=1, sticky="ew")
-        
-        # Configure header grid weights for proper resizing
-        for i in range(len(headers)):
-            header_frame.columnconfigure(i, weight=1)
-        
-        # Table content
-        canvas = tk.Canvas(table_container, bg="white")
-        scrollbar = ttk.Scrollbar(table_container, orient=tk.VERTICAL, command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg="white")
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Display students
-        for i, student in enumerate(students):
-            row_color = "#f8fafc" if i % 2 == 0 else "white"
-            row_frame = tk.Frame(scrollable_frame, bg=row_color)
-            row_frame.pack(fill=tk.X)
-            
-            # Configure grid for proper column alignment
-            for col in range(len(headers)):
-                row_frame.columnconfigure(col, weight=1)
-            
-            # Student Name - Left aligned
-            tk.Label(row_frame, text=student.name, font=("Arial", 9),
-                    bg=row_color, width=25, anchor=tk.W).grid(row=0, column=0, padx=1, pady=2, sticky="w")
-            
-            # Student Code - Center aligned
-            tk.Label(row_frame, text=student.student_code, font=("Arial", 9),
-                    bg=row_color, width=12, anchor=tk.CENTER).grid(row=0, column=1, padx=1, pady=2)
-            
-            # Coursework Total - Center aligned
-            tk.Label(row_frame, text=student.coursework_total, font=("Arial", 9),
-                    bg=row_color, width=12, anchor=tk.CENTER).grid(row=0, column=2, padx=1, pady=2)
-            
-            # Exam Mark - Center aligned
-            tk.Label(row_frame, text=student.exam_mark, font=("Arial", 9),
-                    bg=row_color, width=8, anchor=tk.CENTER).grid(row=0, column=3, padx=1, pady=2)
-            
-            # Percentage - Center aligned
-            tk.Label(row_frame, text=f"{student.percentage:.1f}%", font=("Arial", 9),
-                    bg=row_color, width=10, anchor=tk.CENTER).grid(row=0, column=4, padx=1, pady=2)
-            
-            # Grade - Center aligned with color
-            grade_color = self.get_grade_color(student.grade)
-            tk.Label(row_frame, text=student.grade, font=("Arial", 9, "bold"),
-                    bg=row_color, fg=grade_color, width=8, anchor=tk.CENTER).grid(row=0, column=5, padx=1, pady=2)
-        
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-    
-    def get_grade_color(self, grade):
-        colors = {
-            'A': '#10b981',
-            'B': '#3b82f6',
-            'C': '#f59e0b',
-            'D': '#f97316',
-            'F': '#ef4444'
-        }
-        return colors.get(grade, '#64748b')
-    
-    def view_all_students(self):
-        self.clear_content()
-        
-        header_frame = tk.Frame(self.content_frame, bg=self.colors['light'])
-        header_frame.pack(fill=tk.X, pady=10)
-        
-        tk.Label(header_frame, text="All Student Records", font=("Arial", 16, "bold"),
-                bg=self.colors['light'], fg=self.colors['dark']).pack(anchor=tk.W)
-        
-        students = self.manager.get_all_students()
-        
-        # Create detailed table
-        table_container = tk.Frame(self.content_frame, bg="white", relief=tk.SUNKEN, bd=1)
-        table_container.pack(fill=tk.BOTH, expand=True, pady=10)
-        
-        # Table header
-        header_frame = tk.Frame(table_container, bg=self.colors['header'])
-        header_frame.pack(fill=tk.X)
-        
-        headers = ["Student Name", "Student Code", "CW1", "CW2", "CW3", "Coursework", "Exam", "Total %", "Grade"]
-        widths = [20, 12, 6, 6, 6, 10, 8, 10, 8]  # Character widths
-        
-        for i, (header, width) in enumerate(zip(headers, widths)):
-            tk.Label(header_frame, text=header, font=("Arial", 10, "bold"),
-                    bg=self.colors['header'], fg="white", width=width, anchor=tk.CENTER).grid(
-                    row=0, column=i, padx=1, pady=1, sticky="ew")
-        
-        # Configure header grid
-        for i in range(len(headers)):
-            header_frame.columnconfigure(i, weight=1)
-        
-        # Table content
-        canvas = tk.Canvas(table_container, bg="white")
-        scrollbar = ttk.Scrollbar(table_container, orient=tk.VERTICAL, command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg="white")
-        
-        scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        total_percentage = 0
-        
-        for i, student in enumerate(students):
-            row_color = "#f8fafc" if i % 2 == 0 else "white"
-            row_frame = tk.Frame(scrollable_frame, bg=row_color)
-            row_frame.pack(fill=tk.X)
-            
-            # Configure grid
-            for col in range(len(headers)):
-                row_frame.columnconfigure(col, weight=1)
-            
-            # Student Name - Left aligned
-            tk.Label(row_frame, text=student.name, font=("Arial", 9),
-                    bg=row_color, width=20, anchor=tk.W).grid(row=0, column=0, padx=1, pady=1, sticky="w")
-            
-            # Student Code - Center aligned
-            tk.Label(row_frame, text=student.student_code, font=("Arial", 9),
-                    bg=row_color, width=12, anchor=tk.CENTER).grid(row=0, column=1, padx=1, pady=1)
-            
-            # Individual coursework marks - Center aligned
-            tk.Label(row_frame, text=student.mark1, font=("Arial", 9),
-                    bg=row_color, width=6, anchor=tk.CENTER).grid(row=0, column=2, padx=1, pady=1)
-            tk.Label(row_frame, text=student.mark2, font=("Arial", 9),
-                    bg=row_color, width=6, anchor=tk.CENTER).grid(row=0, column=3, padx=1, pady=1)
-            tk.Label(row_frame, text=student.mark3, font=("Arial", 9),
-                    bg=row_color, width=6, anchor=tk.CENTER).grid(row=0, column=4, padx=1, pady=1)
-            
-            # Coursework Total - Center aligned
-            tk.Label(row_frame, text=student.coursework_total, font=("Arial", 9),
-                    bg=row_color, width=10, anchor=tk.CENTER).grid(row=0, column=5, padx=1, pady=1)
-            
-            # Exam Mark - Center aligned
-            tk.Label(row_frame, text=student.exam_mark, font=("Arial", 9),
-                    bg=row_color, width=8, anchor=tk.CENTER).grid(row=0, column=6, padx=1, pady=1)
-            
-            # Percentage - Center aligned
-            tk.Label(row_frame, text=f"{student.percentage:.1f}%", font=("Arial", 9),
-                    bg=row_color, width=10, anchor=tk.CENTER).grid(row=0, column=7, padx=1, pady=1)
-            
-            # Grade - Center aligned with color
-            grade_color = self.get_grade_color(student.grade)
-            tk.Label(row_frame, text=student.grade, font=("Arial", 9, "bold"),
-                    bg=row_color, fg=grade_color, width=8, anchor=tk.CENTER).grid(row=0, column=8, padx=1, pady=1)
-            
-            total_percentage += student.percentage
-        
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Summary
-        summary_frame = tk.Frame(self.content_frame, bg=self.colors['light'])
-        summary_frame.pack(fill=tk.X, pady=10)
-        
-        tk.Label(summary_frame, text=f"Total Students: {len(students)} | Average Percentage: {total_percentage/len(students):.1f}%", 
-                font=("Arial", 11, "bold"), bg=self.colors['light'], fg=self.colors['dark']).pack()
+        with self.lock:
+            try:
+                self._log_change('U', updated)
+            except Exception as e:
+                return False, f"Error updating student: {str(e)}"
+            self._unindex_student(student)
+            for field in EDITABLE_FIELDS:
+                setattr(student, field, getattr(updated, field))
+            self._index_student(student)
+            self._notify('U', [student])
+        return True, "Student updated successfully"
 
-    # ... (rest of the methods remain the same as in the previous code)
-    def view_individual_student(self):
-        student_code = simpledialog.askinteger("Find Student", "Enter student code:")
-        if student_code is None:
-            return
-        
-        student = self.manager.get_student_by_code(student_code)
-        if not student:
-            messagebox.showerror("Error", f"Student with code {student_code} not found.")
-            return
-        
-        self.clear_content()
-        
-        header_frame = tk.Frame(self.content_frame, bg=self.colors['light'])
-        header_frame.pack(fill=tk.X, pady=10)
-        
-        tk.Label(header_frame, text=f"Student Record - {student.name}", font=("Arial", 16, "bold"),
-                bg=self.colors['light'], fg=self.colors['dark']).pack(anchor=tk.W)
-        
-        # Student details card
-        details_frame = tk.Frame(self.content_frame, bg="white", relief=tk.RAISED, bd=1)
-        details_frame.pack(fill=tk.X, pady=10, padx=50)
-        
-        details = [
-            ("Student Code", student.student_code),
-            ("Student Name", student.name),
-            ("Coursework 1", f"{student.mark1}/20"),
-            ("Coursework 2", f"{student.mark2}/20"),
-            ("Coursework 3", f"{student.mark3}/20"),
-            ("Coursework Total", f"{student.coursework_total}/60"),
-            ("Exam Mark", f"{student.exam_mark}/100"),
-            ("Overall Total", f"{student.total_score}/160"),
-            ("Percentage", f"{student.percentage:.1f}%"),
-            ("Grade", student.grade)
-        ]
-        
-        for i, (label, value) in enumerate(details):
-            row_frame = tk.Frame(details_frame, bg="white")
-            row_frame.pack(fill=tk.X, padx=20, pady=5)
-            
-            tk.Label(row_frame, text=label, font=("Arial", 11, "bold"),
-                    bg="white", fg=self.colors['secondary'], width=15, anchor=tk.W).pack(side=tk.LEFT)
-            tk.Label(row_frame, text=value, font=("Arial", 11),
-                    bg="white", fg=self.colors['dark']).pack(side=tk.LEFT, padx=10)
-    
-    def show_highest_student(self):
-        student = self.manager.get_highest_scoring_student()
-        if not student:
-            messagebox.showinfo("Info", "No students found.")
-            return
-        
-        self.show_student_detail(student, "Highest Scoring Student", "🏆")
+def format_student_row(rank, student):
+    return (f"{rank:>4}. {student.student_code:>8}  {student.name:<30} "
+            f"{student.total_score:>4}/160  {student.percentage:>6.2f}%  {student.grade}")
+
+def print_stats(manager, out):
+    count = len(manager.students)
+    print(f"Students: {count}", file=out)
+    if not count:
+        return
+    highest = manager.get_highest_scoring_student()
+    lowest = manager.get_lowest_scoring_student()
+    print(f"Average: {manager.get_average_percentage():.2f}%", file=out)
+    print(f"Highest: {highest.name} ({highest.student_code}) {highest.percentage:.2f}%", file=out)
+    print(f"Lowest: {lowest.name} ({lowest.student_code}) {lowest.percentage:.2f}%", file=out)
+    print(file=out)
+    print_component_stats(manager, out)
+
+def print_component_stats(manager, out):
+    from student_stats import COMPONENT_LABELS, compute_statistics
+    print(f"{'component':<14} {'mean':>7} {'median':>7} {'Q1':>7} {'Q3':>7} {'std':>7}", file=out)
+    for component, stats in compute_statistics(manager).items():
+        print(f"{COMPONENT_LABELS[component]:<14} {stats.mean:>7.2f} {stats.median:>7.2f} "
+              f"{stats.lower_quartile:>7.2f} {stats.upper_quartile:>7.2f} {stats.std:>7.2f}", file=out)
+
+def print_leaderboard(manager, out, count=10, bottom=False):
+    students = manager.bottom_k(count) if bottom else manager.top_k(count)
+    for rank, student in enumerate(students, start=1):
+        print(format_student_row(rank, student), file=out)
+
+def print_grades(manager, out):
+    distribution = manager.get_grade_distribution()
+    total = len(manager.students) or 1
+    for grade in GRADES:
+        print(f"{grade}: {distribution[grade]:>8}  {distribution[grade] / total * 100:>6.2f}%", file=out)
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Student marks reports. Starts the GUI when no command is given.")
+    commands = parser.add_subparsers(dest="command")
     
-    def show_lowest_student(self):
-        student = self.manager.get_lowest_scoring_student()
-        if not student:
-            messagebox.showinfo("Info", "No students found.")
-            return
-        
-        self.show_student_detail(student, "Lowest Scoring Student", "📉")
+    stats = commands.add_parser("stats", help="print the student count, average and highest/lowest scorers")
+    stats.add_argument("files", nargs="+", help="marks files (text, .bin or SQLite)")
     
-    def show_student_detail(self, student, title, emoji):
-        self.clear_content()
-        
-        header_frame = tk.Frame(self.content_frame, bg=self.colors['light'])
-        header_frame.pack(fill=tk.X, pady=10)
-        
-        tk.Label(header_frame, text=f"{emoji} {title}", font=("Arial", 16, "bold"),
-                bg=self.colors['light'], fg=self.colors['dark']).pack(anchor=tk.W)
-        
-        # Student card
-        card_frame = tk.Frame(self.content_frame, bg="white", relief=tk.RAISED, bd=2)
-        card_frame.pack(fill=tk.X, pady=20, padx=100)
-        
-        # Header with grade
-        card_header = tk.Frame(card_frame, bg=self.get_grade_color(student.grade))
-        card_header.pack(fill=tk.X)
-        
-        tk.Label(card_header, text=f"{student.name} - Grade {student.grade}", 
-                font=("Arial", 14, "bold"), bg=self.get_grade_color(student.grade), 
-                fg="white").pack(pady=10)
-        
-        # Details
-        details_frame = tk.Frame(card_frame, bg="white")
-        details_frame.pack(fill=tk.X, padx=20, pady=15)
-        
-        details = [
-            ("Student Code", student.student_code),
-            ("Coursework Total", f"{student.coursework_total}/60"),
-            ("Exam Mark", f"{student.exam_mark}/100"),
-            ("Overall Score", f"{student.total_score}/160"),
-            ("Percentage", f"{student.percentage:.1f}%")
-        ]
-        
-        for label, value in details:
-            row_frame = tk.Frame(details_frame, bg="white")
-            row_frame.pack(fill=tk.X, pady=8)
-            
-            tk.Label(row_frame, text=label, font=("Arial", 11),
-                    bg="white", fg=self.colors['secondary'], width=15, anchor=tk.W).pack(side=tk.LEFT)
-            tk.Label(row_frame, text=value, font=("Arial", 11, "bold"),
-                    bg="white", fg=self.colors['dark']).pack(side=tk.LEFT)
-    
-    def sort_students(self):
-        # Create sort dialog
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Sort Students")
-        dialog.geometry("300x200")
-        dialog.configure(bg='white')
-        
-        tk.Label(dialog, text="Sort Students By", font=("Arial", 14, "bold"),
-                bg="white", fg=self.colors['dark']).pack(pady=20)
-        
-        sort_var = tk.StringVar(value="name")
-        
-        options = [
-            ("Student Name", "name"),
-            ("Student Code", "code"),
-            ("Percentage", "percentage"),
-            ("Grade", "grade")
-        ]
-        
-        for text, value in options:
-            tk.Radiobutton(dialog, text=text, variable=sort_var, value=value,
-                          bg="white", font=("Arial", 11)).pack(anchor=tk.W, padx=50, pady=5)
-        
-        def apply_sort():
-            sort_by = sort_var.get()
-            students = self.manager.get_all_students()
-            
-            if sort_by == "name":
-                students.sort(key=lambda x: x.name)
-            elif sort_by == "code":
-                students.sort(key=lambda x: x.student_code)
-            elif sort_by == "percentage":
-                students.sort(key=lambda x: x.percentage, reverse=True)
-            elif sort_by == "grade":
-                grade_order = {'A': 4, 'B': 3, 'C': 2, 'D': 1, 'F': 0}
-                students.sort(key=lambda x: grade_order.get(x.grade, 0), reverse=True)
-            
-            dialog.destroy()
-            self.view_all_students()
-        
-        tk.Button(dialog, text="Apply Sort", font=("Arial", 12),
-                 bg=self.colors['primary'], fg="white", command=apply_sort).pack(pady=20)
+    leaderboard = commands.add_parser("leaderboard", help="print the top (or bottom) students by total score")
+    leaderboard.add_argument("files", nargs="+", help="marks files (text, .bin or SQLite)")
+    leaderboard.add_argument("-n", "--count", type=int, default=10, help="number of students (default 10)")
+    leaderboard.add_argument("--bottom", action="store_true", help="list the lowest scorers instead")
     
-    def add_student(self):
-        self.show_add_student_dialog()
+    grades = commands.add_parser("grades", help="print the grade distribution")
+    grades.add_argument("files", nargs="+", help="marks files (text, .bin or SQLite)")
     
-    def update_student(self):
-        student_code = simpledialog.askinteger("Update Student", "Enter student code to update:")
-        if student_code is None:
-            return
-        
-        student = self.manager.get_student_by_code(student_code)
-        if not student:
-            messagebox.showerror("Error", f"Student with code {student_code} not found.")
-            return
-        
-        self.show_update_student_dialog(student)
+    cohorts = commands.add_parser("cohorts", help="merged report over many cohort files, parsed in parallel")
+    cohorts.add_argument("files", nargs="+", help="marks files (text, .bin or SQLite)")
+    cohorts.add_argument("-n", "--count", type=int, default=10, help="leaderboard size (default 10)")
+    cohorts.add_argument("-j", "--jobs", type=int, help="worker processes (default: one per core)")
     
-    def delete_student(self):
-        student_code = simpledialog.askinteger("Delete Student", "Enter student code to delete:")
-        if student_code is None:
-            return
-        
-        student = self.manager.get_student_by_code(student_code)
-        if not student:
-            messagebox.showerror("Error", f"Student with code {student_code} not found.")
-            return
-        
-        confirm = messagebox.askyesno("Confirm Delete", 
-                                     f"Are you sure you want to delete {student.name}?")
-        if confirm:
-            success, message = self.manager.delete_student(student_code)
-            if success:
-                self.manager.save_data()
-                messagebox.showinfo("Success", message)
-                self.show_dashboard()
-            else:
-                messagebox.showerror("Error", message)
-    
-    def show_add_student_dialog(self):
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Add New Student")
-        dialog.geometry("400x500")
-        dialog.configure(bg='white')
-        
-        tk.Label(dialog, text="Add New Student", font=("Arial", 16, "bold"),
-                bg="white", fg=self.colors['dark']).pack(pady=20)
-        
-        form_frame = tk.Frame(dialog, bg="white")
-        form_frame.pack(fill=tk.BOTH, expand=True, padx=30)
-        
-        entries = {}
-        fields = [
-            ("Student Code", "entry"),
-            ("Student Name", "entry"), 
-            ("Coursework 1 (0-20)", "entry"),
-            ("Coursework 2 (0-20)", "entry"),
-            ("Coursework 3 (0-20)", "entry"),
-            ("Exam Mark (0-100)", "entry")
-        ]
-        
-        for i, (label, field_type) in enumerate(fields):
-            tk.Label(form_frame, text=label, font=("Arial", 10), bg="white").grid(row=i, column=0, sticky=tk.W, pady=8)
-            entry = tk.Entry(form_frame, font=("Arial", 10), width=20)
-            entry.grid(row=i, column=1, pady=8, padx=10)
-            entries[label] = entry
-        
-        def submit():
-            try:
-                code = int(entries["Student Code"].get())
-                name = entries["Student Name"].get()
-                m1 = int(entries["Coursework 1 (0-20)"].get())
-                m2 = int(entries["Coursework 2 (0-20)"].get())
-                m3 = int(entries["Coursework 3 (0-20)"].get())
-                exam = int(entries["Exam Mark (0-100)"].get())
-                
-                if not (1000 <= code <= 9999):
-                    messagebox.showerror("Error", "Student code must be between 1000-9999")
-                    return
-                if not all(0 <= mark <= 20 for mark in [m1, m2, m3]):
-                    messagebox.showerror("Error", "Coursework marks must be 0-20")
-                    return
-                if not (0 <= exam <= 100):
-                    messagebox.showerror("Error", "Exam mark must be 0-100")
-                    return
-                
-                success, message = self.manager.add_student(code, name, m1, m2, m3, exam)
-                if success:
-                    self.manager.save_data()
-                    messagebox.showinfo("Success", message)
-                    dialog.destroy()
-                    self.show_dashboard()
-                else:
-                    messagebox.showerror("Error", message)
-            except ValueError:
-                messagebox.showerror("Error", "Please enter valid numbers")
-        
-        tk.Button(dialog, text="Add Student", font=("Arial", 12), 
-                 bg=self.colors['primary'], fg="white", command=submit).pack(pady=20)
-    
-    def show_update_student_dialog(self, student):
-        dialog = tk.Toplevel(self.root)
-        dialog.title(f"Update {student.name}")
-        dialog.geometry("400x500")
-        dialog.configure(bg='white')
-        
-        tk.Label(dialog, text=f"Update {student.name}", font=("Arial", 16, "bold"),
-                bg="white", fg=self.colors['dark']).pack(pady=20)
-        
-        form_frame = tk.Frame(dialog, bg="white")
-        form_frame.pack(fill=tk.BOTH, expand=True, padx=30)
-        
-        entries = {}
-        fields = [
-            ("Student Name", student.name),
-            ("Coursework 1", student.mark1),
-            ("Coursework 2", student.mark2), 
-            ("Coursework 3", student.mark3),
-            ("Exam Mark", student.exam_mark)
-        ]
-        
-        for i, (label, value) in enumerate(fields):
-            tk.Label(form_frame, text=label, font=("Arial", 10), bg="white").grid(row=i, column=0, sticky=tk.W, pady=8)
-            entry = tk.Entry(form_frame, font=("Arial", 10), width=20)
-            entry.insert(0, str(value))
-            entry.grid(row=i, column=1, pady=8, padx=10)
-            entries[label] = entry
-        
-        def submit():
-            try:
-                name = entries["Student Name"].get()
-                m1 = int(entries["Coursework 1"].get())
-                m2 = int(entries["Coursework 2"].get())
-                m3 = int(entries["Coursework 3"].get())
-                exam = int(entries["Exam Mark"].get())
-                
-                if not all(0 <= mark <= 20 for mark in [m1, m2, m3]):
-                    messagebox.showerror("Error", "Coursework marks must be 0-20")
-                    return
-                if not (0 <= exam <= 100):
-                    messagebox.showerror("Error", "Exam mark must be 0-100")
-                    return
-                
-                success, message = self.manager.update_student(
-                    student.student_code, name=name, mark1=m1, mark2=m2, mark3=m3, exam_mark=exam
-                )
-                if success:
-                    self.manager.save_data()
-                    messagebox.showinfo("Success", message)
-                    dialog.destroy()
-                    self.show_dashboard()
-                else:
-                    messagebox.showerror("Error", message)
-            except ValueError:
-                messagebox.showerror("Error", "Please enter valid numbers")
-        
-        tk.Button(dialog, text="Update Student", font=("Arial", 12),
-                 bg=self.colors['primary'], fg="white", command=submit).pack(pady=20)
-
-def main():
-    root = tk.Tk()
-    app = ModernStudentManagerApp(root)
-    root.mainloop()
+    export = commands.add_parser("export", help="convert a marks file to text, CSV, .bin or SQLite")
+    export.add_argument("source")
+    export.add_argument("destination")
+    export.add_argument("--format", choices=ROSTER_FORMATS, help="output format (default: from the extension)")
+    return parser
+
+def print_cohorts(summary, out):
+    print(f"{'cohort':<40} {'students':>9} {'average':>8}", file=out)
+    for filename, count, average in summary.cohorts:
+        print(f"{filename:<40} {count:>9} {average:>7.2f}%", file=out)
+    print(f"\nFiles: {len(summary.cohorts)}  Students: {summary.count}  "
+          f"Average: {summary.average_percentage:.2f}%", file=out)
+    total = summary.count or 1
+    for grade in GRADES:
+        count = summary.grade_counts[grade]
+        print(f"{grade}: {count:>8}  {count / total * 100:>6.2f}%", file=out)
+    print("\nTop students:", file=out)
+    for rank, (total_score, code, name, filename) in enumerate(summary.top, start=1):
+        print(f"{rank:>4}. {code:>8}  {name:<30} {total_score:>4}/160  {filename}", file=out)
+
+def run_cohorts(args, out=sys.stdout, err=sys.stderr):
+    from student_cohorts import analyze_cohorts
+    summary = analyze_cohorts(args.files, top_k=args.count, max_workers=args.jobs)
+    for filename, line_number, line, message in summary.errors:
+        location = f"line {line_number}" if line_number else line
+        print(f"{filename}: skipped {location}: {message}", file=err)
+    print_cohorts(summary, out)
+    return 1 if summary.failed else 0
+
+def run_command(args, out=sys.stdout, err=sys.stderr):
+    """Run a parsed CLI command without touching tkinter; returns the exit status"""
+    if args.command == "cohorts":
+        return run_cohorts(args, out, err)
+    files = [args.source] if args.command == "export" else args.files
+    status = 0
+    for filename in files:
+        if not os.path.exists(filename):
+            # StudentManager would create sample data; reports should never write
+            print(f"{filename}: no such file", file=err)
+            status = 1
+            continue
+        try:
+            manager = StudentManager(filename)
+        except (OSError, ValueError, sqlite3.Error) as e:
+            print(f"{filename}: failed to load: {e}", file=err)
+            status = 1
+            continue
+        try:
+            for line_number, line, message in manager.load_errors:
+                location = f"line {line_number}" if line_number else line
+                print(f"{filename}: skipped {location}: {message}", file=err)
+            
+            if args.command == "export":
+                try:
+                    manager.export(args.destination, args.format)
+                except (OSError, ValueError, sqlite3.Error) as e:
+                    print(f"{args.destination}: failed to export: {e}", file=err)
+                    status = 1
+                    continue
+                print(f"Exported {len(manager.students)} students to {args.destination}", file=out)
+                continue
+            if len(files) > 1:
+                print(f"== {filename} ==", file=out)
+            if args.command == "stats":
+                print_stats(manager, out)
+            elif args.command == "leaderboard":
+                print_leaderboard(manager, out, args.count, args.bottom)
+            elif args.command == "grades":
+                print_grades(manager, out)
+        finally:
+            manager.close()
+    return status
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        # tkinter is only imported when the GUI is actually launched
+        import student_gui
+        student_gui.main()
+        return 0
+    return run_command(args)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Cross-cohort analytics over many marks files, one process per file"""
+import os
+import heapq
+import sqlite3
+from itertools import repeat
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+
+from student import GRADES, open_backend
+
+class CohortSummary:
+    """Mergeable aggregates for one or more marks files"""
+    def __init__(self, top_k=10):
+        self.top_k = top_k
+        self.count = 0
+        self.total_sum = 0
+        self.grade_counts = dict.fromkeys(GRADES, 0)
+        # Students per total score (0-160); enough for medians and bands without the rows
+        self.total_histogram = [0] * 161
+        # (total_score, student_code, name, filename), best first / worst first
+        self.top = []
+        self.bottom = []
+        # (filename, count, average_percentage) for each file folded in
+        self.cohorts = []
+        # (filename, line_number, line, message) for records that could not be read
+        self.errors = []
+        # Files that were missing or could not be read at all
+        self.failed = []
+    
+    def add_file(self, filename, students):
+        """Fold one file's students into the summary"""
+        total_sum = 0
+        for student in students:
+            total_sum += student.total_score
+            self.grade_counts[student.grade] += 1
+            self.total_histogram[student.total_score] += 1
+        self.count += len(students)
+        self.total_sum += total_sum
+        rows = [(s.total_score, s.student_code, s.name, filename) for s in students]
+        self.top = heapq.nlargest(self.top_k, self.top + rows, key=itemgetter(0))
+        self.bottom = heapq.nsmallest(self.top_k, self.bottom + rows, key=itemgetter(0))
+        average = total_sum / len(students) / 160 * 100 if students else 0
+        self.cohorts.append((filename, len(students), average))
+    
+    def merge(self, other):
+        """Fold another summary (typically one file's, from a worker) into this one"""
+        self.count += other.count
+        self.total_sum += other.total_sum
+        for grade in GRADES:
+            self.grade_counts[grade] += other.grade_counts[grade]
+        self.total_histogram = [a + b for a, b in zip(self.total_histogram, other.total_histogram)]
+        self.top = heapq.nlargest(self.top_k, self.top + other.top, key=itemgetter(0))
+        self.bottom = heapq.nsmallest(self.top_k, self.bottom + other.bottom, key=itemgetter(0))
+        self.cohorts.extend(other.cohorts)
+        self.errors.extend(other.errors)
+        self.failed.extend(other.failed)
+        return self
+    
+    @property
+    def average_percentage(self):
+        if not self.count:
+            return 0
+        return self.total_sum / self.count / 160 * 100
+
+def summarize_cohort(filename, top_k=10):
+    """Parse one marks file and return its CohortSummary (runs in a worker process)"""
+    summary = CohortSummary(top_k)
+    if not os.path.exists(filename):
+        summary.errors.append((filename, None, filename, "no such file"))
+        summary.failed.append(filename)
+        return summary
+    
+    def record_error(line_number, line, message):
+        summary.errors.append((filename, line_number, line, message))
+    
+    try:
+        backend = open_backend(filename)
+        try:
+            students = backend.load(on_error=record_error)
+        finally:
+            backend.close()
+    except (OSError, ValueError, sqlite3.Error) as e:
+        summary.errors.append((filename, None, filename, f"failed to load: {e}"))
+        summary.failed.append(filename)
+        return summary
+    summary.add_file(filename, students)
+    return summary
+
+def analyze_cohorts(filenames, top_k=10, max_workers=None):
+    """Summarize every file on a process pool and merge the partial results in file order"""
+    filenames = list(filenames)
+    merged = CohortSummary(top_k)
+    if max_workers == 1 or len(filenames) < 2:
+        for filename in filenames:
+            merged.merge(summarize_cohort(filename, top_k))
+        return merged
+    
+    workers = max_workers or os.cpu_count() or 1
+    # Batch small files together so per-task pickling does not dominate
+    chunksize = max(1, len(filenames) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for summary in pool.map(summarize_cohort, filenames, repeat(top_k), chunksize=chunksize):
+            merged.merge(summary)
+    return merged
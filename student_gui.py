@@ -0,0 +1,1167 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, simpledialog, filedialog
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from student import GRADES, StudentManager, iter_csv_students
+from student_stats import COMPONENT_LABELS, compute_statistics
+
+class BackgroundIO:
+    """Runs file I/O on a worker thread and hands results back on the Tk thread via root.after"""
+    def __init__(self, root, poll_ms=50, save_delay_ms=300):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.save_delay_ms = save_delay_ms
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="student-io")
+        self._save_job = None
+        self._saving = False
+        self._save_requested = False
+    
+    def submit(self, func, on_done, on_error):
+        """Run func on the worker; call on_done(result) or on_error(exception) on the Tk thread"""
+        future = self.executor.submit(func)
+        self.root.after(self.poll_ms, self._poll, future, on_done, on_error)
+        return future
+    
+    def _poll(self, future, on_done, on_error):
+        if not future.done():
+            self.root.after(self.poll_ms, self._poll, future, on_done, on_error)
+        elif future.exception() is not None:
+            on_error(future.exception())
+        else:
+            on_done(future.result())
+    
+    def request_save(self, save, on_error):
+        """Schedule save() on the worker, coalescing requests that arrive while one is pending"""
+        self._save_requested = True
+        if self._save_job is None and not self._saving:
+            self._save_job = self.root.after(self.save_delay_ms, self._start_save, save, on_error)
+    
+    def _start_save(self, save, on_error):
+        self._save_job = None
+        self._save_requested = False
+        self._saving = True
+        
+        def finished(result=None):
+            self._saving = False
+            if self._save_requested:
+                self._save_job = self.root.after(self.save_delay_ms, self._start_save, save, on_error)
+        
+        def failed(exception):
+            finished()
+            on_error(exception)
+        
+        self.submit(save, finished, failed)
+    
+    def shutdown(self):
+        """Cancel any queued save and wait for the worker to finish its current job"""
+        if self._save_job is not None:
+            self.root.after_cancel(self._save_job)
+            self._save_job = None
+        self.executor.shutdown(wait=True)
+
+class VirtualStudentTable(tk.Frame):
+    """Treeview table that only materializes the rows in view and refills them as the user scrolls"""
+    def __init__(self, parent, headers, widths, row_values, grade_color):
+        super().__init__(parent, bg="white", relief=tk.SUNKEN, bd=1)
+        self.row_values = row_values
+        self.students = []
+        self.offset = 0
+        self._items = []
+        
+        style = ttk.Style(self)
+        style.configure("Students.Treeview", font=("Arial", 9), rowheight=22)
+        style.configure("Students.Treeview.Heading", font=("Arial", 10, "bold"))
+        self.row_height = 22
+        
+        columns = [f"c{i}" for i in range(len(headers))]
+        self.tree = ttk.Treeview(self, columns=columns, show="headings", height=5,
+                                 selectmode="browse", style="Students.Treeview")
+        for i, (column, header, width) in enumerate(zip(columns, headers, widths)):
+            self.tree.heading(column, text=header)
+            self.tree.column(column, width=width * 8, anchor=tk.W if i == 0 else tk.CENTER)
+        
+        for grade in GRADES:
+            self.tree.tag_configure(grade, foreground=grade_color(grade))
+        self.tree.tag_configure("even", background="#f8fafc")
+        self.tree.tag_configure("odd", background="white")
+        
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.on_scrollbar)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.tree.bind("<Configure>", self.on_resize)
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll_to(self.offset + (-3 if e.delta > 0 else 3)))
+        self.tree.bind("<Button-4>", lambda e: self.scroll_to(self.offset - 3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_to(self.offset + 3))
+        self.resize_pool(5)
+    
+    def set_students(self, students):
+        self.students = students
+        self.scroll_to(self.offset)
+    
+    def student_for_item(self, item):
+        """Return the student shown in a Treeview item, or None"""
+        index = self.offset + self._items.index(item) if item in self._items else None
+        if index is None or index >= len(self.students):
+            return None
+        return self.students[index]
+    
+    def resize_pool(self, visible_rows):
+        # The item pool is sized to the viewport, never to the roster
+        while len(self._items) < visible_rows:
+            self._items.append(self.tree.insert("", tk.END))
+        while len(self._items) > visible_rows:
+            self.tree.delete(self._items.pop())
+        self.render()
+    
+    def on_resize(self, event):
+        # Subtract one row for the heading
+        visible_rows = max(1, event.height // self.row_height - 1)
+        if visible_rows != len(self._items):
+            self.resize_pool(visible_rows)
+    
+    def on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self.students)))
+        elif unit == "pages":
+            self.scroll_to(self.offset + int(amount) * len(self._items))
+        else:
+            self.scroll_to(self.offset + int(amount))
+    
+    def scroll_to(self, offset):
+        self.offset = max(0, min(offset, len(self.students) - len(self._items)))
+        self.render()
+    
+    def render(self):
+        count = len(self.students)
+        for i, item in enumerate(self._items):
+            index = self.offset + i
+            if index < count:
+                student = self.students[index]
+                tags = (student.grade, "even" if index % 2 == 0 else "odd")
+                self.tree.item(item, values=self.row_values(student), tags=tags)
+                self.tree.move(item, "", i)
+            else:
+                self.tree.detach(item)
+        
+        if count:
+            self.scrollbar.set(self.offset / count, min(1.0, (self.offset + len(self._items)) / count))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+class ModernStudentManagerApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Student Manager")
+        self.root.geometry("1200x800")
+        self.root.configure(bg='#f8fafc')
+        
+        # The student manager is loaded on a worker thread; see load_students
+        self.manager = None
+        self.io = BackgroundIO(self.root)
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        
+        # Colors
+        self.colors = {
+            'primary': '#3b82f6',
+            'secondary': '#64748b',
+            'success': '#10b981',
+            'warning': '#f59e0b',
+            'danger': '#ef4444',
+            'light': '#f8fafc',
+            'dark': '#1e293b',
+            'sidebar': '#1e293b',
+            'header': '#334155'
+        }
+        
+        # Current "Sort & Filter" ordering as [(field, descending), ...]
+        self.sort_order = []
+        # Current "Sort & Filter" filters as StudentManager.query keyword arguments
+        self.filters = {}
+        
+        # Number of students shown in the top/bottom leaderboards
+        self.leaderboard_size = 10
+        
+        # Find Student waits for a pause in typing before searching
+        self.search_delay_ms = 150
+        
+        # Refreshes the current view in place after roster changes; set by each view
+        self.view_refresh = None
+        # Number of similar names shown when a search has no prefix matches
+        self.fuzzy_results = 50
+        self._search_job = None
+        
+        self.load_students("studentMarks.txt")
+    
+    def load_students(self, filename):
+        """Show a loading screen while the marks file is read on the worker thread"""
+        self.loading_frame = tk.Frame(self.root, bg=self.colors['light'])
+        self.loading_frame.pack(fill=tk.BOTH, expand=True)
+        
+        tk.Label(self.loading_frame, text="Loading student records...", font=("Arial", 16, "bold"),
+                bg=self.colors['light'], fg=self.colors['dark']).pack(pady=(300, 10))
+        self.loading_label = tk.Label(self.loading_frame, text="", font=("Arial", 11),
+                                      bg=self.colors['light'], fg=self.colors['secondary'])
+        self.loading_label.pack()
+        self.loading_bar = ttk.Progressbar(self.loading_frame, length=300, mode="determinate")
+        self.loading_bar.pack(pady=10)
+        
+        # Written by the worker, read by update_load_progress on the Tk thread
+        self.load_progress = (0, None)
+        
+        def record_progress(loaded, expected):
+            self.load_progress = (loaded, expected)
+        
+        self.io.submit(lambda: StudentManager(filename, progress=record_progress, journal=True),
+                       self.students_loaded, self.students_load_failed)
+        self.update_load_progress()
+    
+    def update_load_progress(self):
+        if self.manager is not None or not self.loading_frame.winfo_exists():
+            return
+        loaded, expected = self.load_progress
+        if expected:
+            self.loading_bar['value'] = min(loaded / expected, 1) * 100
+            self.loading_label.config(text=f"{loaded} of {expected} students")
+        else:
+            self.loading_label.config(text=f"{loaded} students")
+        self.root.after(100, self.update_load_progress)
+    
+    def students_loaded(self, manager):
+        self.manager = manager
+        self.manager.subscribe(self.on_students_changed)
+        self.loading_frame.destroy()
+        self.setup_gui()
+        self.report_load_errors()
+        # Warm the fuzzy name index off the Tk thread so the first misspelt search is instant
+        self.io.submit(self.manager.build_fuzzy_index, lambda result: None, lambda e: None)
+    
+    def students_load_failed(self, exception):
+        messagebox.showerror("Error", f"Failed to load data: {str(exception)}")
+        self.root.destroy()
+    
+    def save_students(self):
+        """Persist edits in the background; bursts of edits are written once"""
+        self.io.request_save(self.manager.write_data, self.save_failed)
+    
+    def save_failed(self, exception):
+        messagebox.showerror("Error", f"Failed to save data: {str(exception)}")
+    
+    def close(self):
+        self.io.shutdown()
+        if self.manager is not None:
+            # Fold journaled edits back into studentMarks.txt before exiting
+            try:
+                self.manager.write_data()
+                if self.manager.backend.journal_size():
+                    self.manager.compact()
+                self.manager.close()
+            except OSError as e:
+                messagebox.showerror("Error", f"Failed to save data: {str(e)}")
+        self.root.destroy()
+    
+    def report_load_errors(self):
+        errors = self.manager.load_errors
+        if not errors:
+            return
+        lines = [f"Line {line_number}: {message}" if line_number else message
+                 for line_number, line, message in errors[:10]]
+        if len(errors) > 10:
+            lines.append(f"... and {len(errors) - 10} more")
+        messagebox.showwarning("Skipped Records", f"{len(errors)} record(s) could not be loaded:\n\n" + "\n".join(lines))
+    
+    def setup_gui(self):
+        # Create main container
+        main_container = tk.Frame(self.root, bg=self.colors['light'])
+        main_container.pack(fill=tk.BOTH, expand=True)
+        
+        # Sidebar
+        self.create_sidebar(main_container)
+        
+        # Main content area
+        self.create_main_content(main_container)
+    
+    def create_sidebar(self, parent):
+        sidebar = tk.Frame(parent, bg=self.colors['sidebar'], width=250)
+        sidebar.pack(side=tk.LEFT, fill=tk.Y)
+        sidebar.pack_propagate(False)
+        
+        # Logo/Title
+        title_frame = tk.Frame(sidebar, bg=self.colors['sidebar'])
+        title_frame.pack(fill=tk.X, pady=20, padx=15)
+        
+        tk.Label(title_frame, text="STUDENT MANAGER", font=("Arial", 16, "bold"), 
+                bg=self.colors['sidebar'], fg="white").pack(anchor=tk.W)
+        
+        # Navigation menu
+        nav_frame = tk.Frame(sidebar, bg=self.colors['sidebar'])
+        nav_frame.pack(fill=tk.X, padx=15, pady=20)
+        
+        # Main navigation sections
+        main_nav_items = [
+            ("📊 Dashboard", self.show_dashboard),
+            ("👥 All Students", self.view_all_students),
+            ("🔍 Find Student", self.view_individual_student)
+        ]
+        
+        tk.Label(nav_frame, text="MAIN NAVIGATION", font=("Arial", 10, "bold"),
+                bg=self.colors['sidebar'], fg="#94a3b8").pack(anchor=tk.W, pady=(0, 10))
+        
+        for text, command in main_nav_items:
+            btn = tk.Button(nav_frame, text=text, font=("Arial", 11), 
+                          bg=self.colors['sidebar'], fg="#cbd5e1", bd=0,
+                          anchor=tk.W, justify=tk.LEFT,
+                          command=command)
+            btn.pack(fill=tk.X, pady=3)
+            btn.bind("<Enter>", lambda e, b=btn: b.config(bg=self.colors['primary'], fg="white"))
+            btn.bind("<Leave>", lambda e, b=btn: b.config(bg=self.colors['sidebar'], fg="#cbd5e1"))
+        
+        # Analytics section
+        tk.Label(nav_frame, text="ANALYTICS", font=("Arial", 10, "bold"),
+                bg=self.colors['sidebar'], fg="#94a3b8").pack(anchor=tk.W, pady=(20, 10))
+        
+        analytics_items = [
+            ("🏆 Top Performers", self.show_highest_student),
+            ("📉 Lowest Scores", self.show_lowest_student),
+            ("📊 Sort & Filter", self.sort_students)
+        ]
+        
+        for text, command in analytics_items:
+            btn = tk.Button(nav_frame, text=text, font=("Arial", 11), 
+                          bg=self.colors['sidebar'], fg="#cbd5e1", bd=0,
+                          anchor=tk.W, justify=tk.LEFT,
+                          command=command)
+            btn.pack(fill=tk.X, pady=3)
+            btn.bind("<Enter>", lambda e, b=btn: b.config(bg=self.colors['primary'], fg="white"))
+            btn.bind("<Leave>", lambda e, b=btn: b.config(bg=self.colors['sidebar'], fg="#cbd5e1"))
+        
+        # Management section
+        tk.Label(nav_frame, text="MANAGEMENT", font=("Arial", 10, "bold"),
+                bg=self.colors['sidebar'], fg="#94a3b8").pack(anchor=tk.W, pady=(20, 10))
+        
+        management_items = [
+            ("➕ Add Student", self.add_student),
+            ("✏️ Edit Records", self.update_student),
+            ("🗑️ Delete Student", self.delete_student),
+            ("📥 Import CSV", self.import_students),
+            ("📤 Export Records", self.export_students)
+        ]
+        
+        for text, command in management_items:
+            btn = tk.Button(nav_frame, text=text, font=("Arial", 11), 
+                          bg=self.colors['sidebar'], fg="#cbd5e1", bd=0,
+                          anchor=tk.W, justify=tk.LEFT,
+                          command=command)
+            btn.pack(fill=tk.X, pady=3)
+            btn.bind("<Enter>", lambda e, b=btn: b.config(bg=self.colors['primary'], fg="white"))
+            btn.bind("<Leave>", lambda e, b=btn: b.config(bg=self.colors['sidebar'], fg="#cbd5e1"))
+        
+        # Progress section
+        progress_frame = tk.Frame(sidebar, bg=self.colors['sidebar'])
+        progress_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=15, pady=20)
+        
+        tk.Label(progress_frame, text="YOUR PROGRESS", font=("Arial", 10, "bold"),
+                bg=self.colors['sidebar'], fg="#94a3b8").pack(anchor=tk.W)
+        
+        self.students_managed_label = tk.Label(progress_frame, font=("Arial", 10),
+                                               bg=self.colors['sidebar'], fg="#cbd5e1")
+        self.students_managed_label.pack(anchor=tk.W, pady=(5, 0))
+        
+        self.sidebar_grades_label = tk.Label(progress_frame, font=("Arial", 9),
+                                             bg=self.colors['sidebar'], fg="#94a3b8")
+        self.sidebar_grades_label.pack(anchor=tk.W, pady=(2, 10))
+        self.refresh_sidebar()
+        
+        # Sign out button
+        signout_btn = tk.Button(sidebar, text="🚪 Sign Out", font=("Arial", 11),
+                               bg=self.colors['sidebar'], fg="#cbd5e1", bd=0,
+                               command=self.close)
+        signout_btn.pack(side=tk.BOTTOM, fill=tk.X, padx=15, pady=10)
+        signout_btn.bind("<Enter>", lambda e: signout_btn.config(bg=self.colors['danger'], fg="white"))
+        signout_btn.bind("<Leave>", lambda e: signout_btn.config(bg=self.colors['sidebar'], fg="#cbd5e1"))
+    
+    def refresh_sidebar(self):
+        self.students_managed_label.config(text=f"{len(self.manager.students)} Students Managed")
+        grade_count = self.manager.get_grade_distribution()
+        grade_text = " | ".join([f"{grade}:{count}" for grade, count in grade_count.items() if count > 0])
+        self.sidebar_grades_label.config(text=f"Grades: {grade_text}")
+    
+    def on_students_changed(self, op, students):
+        # Update counters and the visible view in place instead of rebuilding the page
+        self.refresh_sidebar()
+        if self.view_refresh is not None:
+            self.view_refresh(op, students)
+    
+    def create_main_content(self, parent):
+        main_content = tk.Frame(parent, bg=self.colors['light'])
+        main_content.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
+        
+        # Header
+        header = tk.Frame(main_content, bg="white", height=80)
+        header.pack(fill=tk.X)
+        header.pack_propagate(False)
+        
+        tk.Label(header, text="Student Analytics Dashboard", font=("Arial", 20, "bold"),
+                bg="white", fg=self.colors['dark']).pack(side=tk.LEFT, padx=30, pady=20)
+        
+        # Content area
+        self.content_frame = tk.Frame(main_content, bg=self.colors['light'])
+        self.content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # Show dashboard by default
+        self.show_dashboard()
+    
+    def clear_content(self):
+        # A pending search would otherwise fire into destroyed widgets
+        if self._search_job is not None:
+            self.root.after_cancel(self._search_job)
+            self._search_job = None
+        self.view_refresh = None
+        for widget in self.content_frame.winfo_children():
+            widget.destroy()
+    
+    def create_card(self, parent, title, value, color, width=200):
+        card = tk.Frame(parent, bg="white", relief=tk.RAISED, bd=1)
+        card.pack(side=tk.LEFT, padx=10, pady=10)
+        
+        tk.Label(card, text=title, font=("Arial", 12), 
+                bg="white", fg=self.colors['secondary']).pack(pady=(15, 5))
+        
+        value_label = tk.Label(card, text=value, font=("Arial", 24, "bold"),
+                              bg="white", fg=color)
+        value_label.pack(pady=5)
+        
+        # Returned so views can update the figure in place
+        return value_label
+    
+    def show_dashboard(self):
+        self.clear_content()
+        
+        # Welcome section
+        welcome_frame = tk.Frame(self.content_frame, bg=self.colors['light'])
+        welcome_frame.pack(fill=tk.X, pady=10)
+        
+        tk.Label(welcome_frame, text="Welcome to Student Manager", 
+                font=("Arial", 16, "bold"), bg=self.colors['light'], 
+                fg=self.colors['dark']).pack(anchor=tk.W)
+        
+        tk.Label(welcome_frame, text="Manage and analyze student performance data", 
+                font=("Arial", 12), bg=self.colors['light'], 
+                fg=self.colors['secondary']).pack(anchor=tk.W, pady=(5, 20))
+        
+        # Stats cards
+        stats_frame = tk.Frame(self.content_frame, bg=self.colors['light'])
+        stats_frame.pack(fill=tk.X, pady=10)
+        
+        total_card = self.create_card(stats_frame, "Total Students", "", self.colors['primary'])
+        average_card = self.create_card(stats_frame, "Average %", "", self.colors['success'])
+        highest_card = self.create_card(stats_frame, "Highest Score", "", self.colors['warning'])
+        lowest_card = self.create_card(stats_frame, "Lowest Score", "", self.colors['danger'])
+        
+        # Grade distribution card
+        grade_frame = tk.Frame(self.content_frame, bg=self.colors['light'])
+        grade_frame.pack(fill=tk.X, pady=10)
+        
+        grade_card = tk.Frame(grade_frame, bg="white", relief=tk.RAISED, bd=1)
+        grade_card.pack(side=tk.LEFT, padx=10, pady=10)
+        
+        tk.Label(grade_card, text="Grade Distribution", font=("Arial", 12), 
+                bg="white", fg=self.colors['secondary']).pack(pady=(15, 10))
+        
+        grade_labels = {}
+        for grade in GRADES:
+            grade_row = tk.Frame(grade_card, bg="white")
+            grade_row.pack(fill=tk.X, padx=10, pady=2)
+            tk.Label(grade_row, text=grade, font=("Arial", 10, "bold"), 
+                    bg="white", fg=self.get_grade_color(grade), width=3).pack(side=tk.LEFT)
+            grade_labels[grade] = tk.Label(grade_row, font=("Arial", 10), bg="white", fg=self.colors['dark'])
+            grade_labels[grade].pack(side=tk.LEFT, padx=10)
+        
+        refresh_statistics = self.create_statistics_card(grade_frame)
+        
+        # Recent students table
+        table_frame = tk.Frame(self.content_frame, bg=self.colors['light'])
+        table_frame.pack(fill=tk.BOTH, expand=True, pady=20)
+        
+        tk.Label(table_frame, text="Recent Student Records", font=("Arial", 14, "bold"),
+                bg=self.colors['light'], fg=self.colors['dark']).pack(anchor=tk.W)
+        
+        # Create table
+        table = self.create_students_table(table_frame, self.manager.students[:10])  # Show first 10 students
+        
+        def refresh(op=None, students=None):
+            highest_student = self.manager.get_highest_scoring_student()
+            lowest_student = self.manager.get_lowest_scoring_student()
+            total_card.config(text=len(self.manager.students))
+            average_card.config(text=f"{self.manager.get_average_percentage():.1f}%")
+            highest_card.config(text=f"{highest_student.percentage:.1f}%" if highest_student else "N/A")
+            lowest_card.config(text=f"{lowest_student.percentage:.1f}%" if lowest_student else "N/A")
+            grade_count = self.manager.get_grade_distribution()
+            for grade, label in grade_labels.items():
+                label.config(text=f"{grade_count[grade]} students")
+            if op is not None:
+                refresh_statistics()
+                table.set_students(self.manager.students[:10])
+        
+        refresh()
+        self.view_refresh = refresh
+    
+    def create_statistics_card(self, parent):
+        stats_card = tk.Frame(parent, bg="white", relief=tk.RAISED, bd=1)
+        stats_card.pack(side=tk.LEFT, fill=tk.Y, padx=10, pady=10)
+        
+        tk.Label(stats_card, text="Mark Statistics", font=("Arial", 12),
+                bg="white", fg=self.colors['secondary']).pack(pady=(15, 10))
+        
+        table = tk.Frame(stats_card, bg="white")
+        table.pack(padx=10, pady=(0, 10))
+        headers = ["Component", "Median", "Q1 - Q3", "Std Dev", "Distribution (0-100%)"]
+        for column, header in enumerate(headers):
+            tk.Label(table, text=header, font=("Arial", 10, "bold"), bg="white",
+                    fg=self.colors['dark']).grid(row=0, column=column, padx=6, sticky=tk.W)
+        
+        rows = {}
+        for row, component in enumerate(COMPONENT_LABELS, start=1):
+            tk.Label(table, text=COMPONENT_LABELS[component], font=("Arial", 10), bg="white",
+                    fg=self.colors['dark']).grid(row=row, column=0, padx=6, sticky=tk.W)
+            labels = [tk.Label(table, font=("Arial", 10), bg="white", fg=self.colors['dark']) for _ in range(3)]
+            # The last column is a text histogram
+            labels.append(tk.Label(table, font=("Courier", 10), bg="white", fg=self.colors['primary']))
+            for column, label in enumerate(labels, start=1):
+                label.grid(row=row, column=column, padx=6, sticky=tk.W)
+            rows[component] = labels
+        
+        def refresh():
+            # Exact count histograms over the small integer mark ranges; no sorting per refresh
+            for component, stats in compute_statistics(self.manager).items():
+                values = [f"{stats.median:g}", f"{stats.lower_quartile:g} - {stats.upper_quartile:g}",
+                          f"{stats.std:.1f}", self.sparkline(stats.percentage_bins())]
+                for label, value in zip(rows[component], values):
+                    label.config(text=value)
+        
+        refresh()
+        return refresh
+    
+    def sparkline(self, counts):
+        bars = "▁▂▃▄▅▆▇█"
+        peak = max(counts) or 1
+        return "".join(bars[round(count / peak * (len(bars) - 1))] for count in counts)
+    
+    def create_students_table(self, parent, students):
+        headers = ["Student Name", "Student Code", "Coursework", "Exam", "Total %", "Grade"]
+        widths = [25, 12, 12, 8, 10, 8]  # Character widths for proper alignment
+        
+        def row_values(student):
+            return (student.name, student.student_code, student.coursework_total,
+                    student.exam_mark, f"{student.percentage:.1f}%", student.grade)
+        
+        table = VirtualStudentTable(parent, headers, widths, row_values, self.get_grade_color)
+        table.pack(fill=tk.BOTH, expand=True, pady=10)
+        table.set_students(students)
+        return table
+    
+    def get_grade_color(self, grade):
+        colors = {
+            'A': '#10b981',
+            'B': '#3b82f6',
+            'C': '#f59e0b',
+            'D': '#f97316',
+            'F': '#ef4444'
+        }
+        return colors.get(grade, '#64748b')
+    
+    def view_all_students(self):
+        self.clear_content()
+        
+        header_frame = tk.Frame(self.content_frame, bg=self.colors['light'])
+        header_frame.pack(fill=tk.X, pady=10)
+        
+        tk.Label(header_frame, text="All Student Records", font=("Arial", 16, "bold"),
+                bg=self.colors['light'], fg=self.colors['dark']).pack(anchor=tk.W)
+        
+        if self.filters:
+            filter_label = tk.Label(header_frame, font=("Arial", 10), bg=self.colors['light'], fg=self.colors['secondary'])
+            filter_label.pack(anchor=tk.W)
+        
+        # Create detailed table
+        headers = ["Student Name", "Student Code", "CW1", "CW2", "CW3", "Coursework", "Exam", "Total %", "Grade"]
+        widths = [20, 12, 6, 6, 6, 10, 8, 10, 8]  # Character widths
+        
+        def row_values(student):
+            return (student.name, student.student_code, student.mark1, student.mark2, student.mark3,
+                    student.coursework_total, student.exam_mark, f"{student.percentage:.1f}%", student.grade)
+        
+        table = VirtualStudentTable(self.content_frame, headers, widths, row_values, self.get_grade_color)
+        table.pack(fill=tk.BOTH, expand=True, pady=10)
+        
+        # Summary
+        summary_frame = tk.Frame(self.content_frame, bg=self.colors['light'])
+        summary_frame.pack(fill=tk.X, pady=10)
+        
+        summary_label = tk.Label(summary_frame, font=("Arial", 11, "bold"), bg=self.colors['light'], fg=self.colors['dark'])
+        summary_label.pack()
+        
+        def refresh(op=None, changed=None):
+            # Sorting produces a cached view; the roster itself keeps its order
+            if self.sort_order:
+                students = self.manager.sorted_view(self.sort_order)
+            else:
+                students = self.manager.get_all_students()
+            
+            if self.filters:
+                matches = self.manager.query(**self.filters)
+                if self.sort_order:
+                    matched = {s.student_code for s in matches}
+                    matches = [s for s in students if s.student_code in matched]
+                students = matches
+                filter_label.config(text=f"Showing {len(students)} of {len(self.manager.students)} students matching the current filters")
+                average = sum(s.percentage for s in students) / len(students) if students else 0
+            else:
+                average = self.manager.get_average_percentage()
+            
+            # Keeps the scroll position; only the visible rows are re-rendered
+            table.set_students(students)
+            summary_label.config(text=f"Total Students: {len(students)} | Average Percentage: {average:.1f}%")
+        
+        refresh()
+        self.view_refresh = refresh
+
+    # ... (rest of the methods remain the same as in the previous code)
+    def view_individual_student(self):
+        self.clear_content()
+        
+        header_frame = tk.Frame(self.content_frame, bg=self.colors['light'])
+        header_frame.pack(fill=tk.X, pady=10)
+        
+        tk.Label(header_frame, text="Find Student", font=("Arial", 16, "bold"),
+                bg=self.colors['light'], fg=self.colors['dark']).pack(anchor=tk.W)
+        tk.Label(header_frame, text="Type a name (or a student code) and double-click a result to open it",
+                font=("Arial", 10), bg=self.colors['light'], fg=self.colors['secondary']).pack(anchor=tk.W)
+        
+        query = tk.StringVar()
+        entry = tk.Entry(self.content_frame, textvariable=query, font=("Arial", 12))
+        entry.pack(fill=tk.X, pady=10)
+        entry.focus_set()
+        
+        count_label = tk.Label(self.content_frame, text="", font=("Arial", 10),
+                              bg=self.colors['light'], fg=self.colors['secondary'])
+        count_label.pack(anchor=tk.W)
+        
+        headers = ["Student Name", "Student Code", "Coursework", "Exam", "Total %", "Grade"]
+        widths = [25, 12, 12, 8, 10, 8]
+        
+        def row_values(student):
+            return (student.name, student.student_code, student.coursework_total,
+                    student.exam_mark, f"{student.percentage:.1f}%", student.grade)
+        
+        table = VirtualStudentTable(self.content_frame, headers, widths, row_values, self.get_grade_color)
+        table.pack(fill=tk.BOTH, expand=True, pady=10)
+        
+        def run_search():
+            self._search_job = None
+            text = query.get().strip()
+            if text.isdigit():
+                student = self.manager.get_student_by_code(int(text))
+                matches = [student] if student else []
+            elif text:
+                # A lazy view over the sorted name index; the table only reads the visible rows
+                matches = self.manager.match_name_prefix(text)
+            else:
+                matches = []
+            label = f"{len(matches)} match(es)" if text else ""
+            if text and not matches:
+                # Nothing starts with the text; fall back to ranked similar names
+                matches = self.manager.fuzzy_search(text, limit=self.fuzzy_results)
+                label = f"No exact matches - {len(matches)} similar name(s)"
+            table.offset = 0
+            table.set_students(matches)
+            count_label.config(text=label)
+        
+        def schedule_search(*args):
+            # Debounce: only search once typing pauses
+            if self._search_job is not None:
+                self.root.after_cancel(self._search_job)
+            self._search_job = self.root.after(self.search_delay_ms, run_search)
+        
+        def open_selected(event):
+            student = table.student_for_item(table.tree.focus())
+            if student:
+                self.show_student_record(student)
+        
+        self._search_job = None
+        query.trace_add("write", schedule_search)
+        entry.bind("<Return>", lambda e: run_search())
+        table.tree.bind("<Double-1>", open_selected)
+        table.tree.bind("<Return>", open_selected)
+        # Match views are invalidated by roster changes, so search again in place
+        self.view_refresh = lambda op, students: run_search()
+    
+    def show_student_record(self, student):
+        self.clear_content()
+        
+        header_frame = tk.Frame(self.content_frame, bg=self.colors['light'])
+        header_frame.pack(fill=tk.X, pady=10)
+        
+        title_label = tk.Label(header_frame, font=("Arial", 16, "bold"),
+                              bg=self.colors['light'], fg=self.colors['dark'])
+        title_label.pack(anchor=tk.W)
+        
+        # Student details card
+        details_frame = tk.Frame(self.content_frame, bg="white", relief=tk.RAISED, bd=1)
+        details_frame.pack(fill=tk.X, pady=10, padx=50)
+        
+        def details():
+            return [
+                ("Student Code", student.student_code),
+                ("Student Name", student.name),
+                ("Coursework 1", f"{student.mark1}/20"),
+                ("Coursework 2", f"{student.mark2}/20"),
+                ("Coursework 3", f"{student.mark3}/20"),
+                ("Coursework Total", f"{student.coursework_total}/60"),
+                ("Exam Mark", f"{student.exam_mark}/100"),
+                ("Overall Total", f"{student.total_score}/160"),
+                ("Percentage", f"{student.percentage:.1f}%"),
+                ("Grade", student.grade)
+            ]
+        
+        value_labels = []
+        for label, value in details():
+            row_frame = tk.Frame(details_frame, bg="white")
+            row_frame.pack(fill=tk.X, padx=20, pady=5)
+            
+            tk.Label(row_frame, text=label, font=("Arial", 11, "bold"),
+                    bg="white", fg=self.colors['secondary'], width=15, anchor=tk.W).pack(side=tk.LEFT)
+            value_labels.append(tk.Label(row_frame, font=("Arial", 11), bg="white", fg=self.colors['dark']))
+            value_labels[-1].pack(side=tk.LEFT, padx=10)
+        
+        def refresh(op=None, students=()):
+            if op is not None and student not in students:
+                return
+            if op == 'D':
+                title_label.config(text=f"Student Record - {student.name} (deleted)")
+                return
+            title_label.config(text=f"Student Record - {student.name}")
+            for value_label, (label, value) in zip(value_labels, details()):
+                value_label.config(text=value)
+        
+        refresh()
+        self.view_refresh = refresh
+    
+    def show_highest_student(self):
+        student = self.manager.get_highest_scoring_student()
+        if not student:
+            messagebox.showinfo("Info", "No students found.")
+            return
+        
+        self.show_student_detail("Highest Scoring Student", "🏆", self.manager.get_highest_scoring_student,
+                                 leaderboard=lambda: self.manager.top_k(self.leaderboard_size),
+                                 leaderboard_title="Top Performers Leaderboard")
+    
+    def show_lowest_student(self):
+        student = self.manager.get_lowest_scoring_student()
+        if not student:
+            messagebox.showinfo("Info", "No students found.")
+            return
+        
+        self.show_student_detail("Lowest Scoring Student", "📉", self.manager.get_lowest_scoring_student,
+                                 leaderboard=lambda: self.manager.bottom_k(self.leaderboard_size),
+                                 leaderboard_title="Lowest Scores Leaderboard")
+    
+    def show_student_detail(self, title, emoji, get_student, leaderboard=None, leaderboard_title=""):
+        """Show the student returned by get_student, and optionally the list returned by leaderboard,
+        re-reading both whenever the roster changes"""
+        self.clear_content()
+        
+        header_frame = tk.Frame(self.content_frame, bg=self.colors['light'])
+        header_frame.pack(fill=tk.X, pady=10)
+        
+        tk.Label(header_frame, text=f"{emoji} {title}", font=("Arial", 16, "bold"),
+                bg=self.colors['light'], fg=self.colors['dark']).pack(anchor=tk.W)
+        
+        # Student card
+        card_frame = tk.Frame(self.content_frame, bg="white", relief=tk.RAISED, bd=2)
+        card_frame.pack(fill=tk.X, pady=20, padx=100)
+        
+        # Header with grade
+        card_header = tk.Frame(card_frame)
+        card_header.pack(fill=tk.X)
+        
+        header_label = tk.Label(card_header, font=("Arial", 14, "bold"), fg="white")
+        header_label.pack(pady=10)
+        
+        # Details
+        details_frame = tk.Frame(card_frame, bg="white")
+        details_frame.pack(fill=tk.X, padx=20, pady=15)
+        
+        labels = ["Student Code", "Coursework Total", "Exam Mark", "Overall Score", "Percentage"]
+        value_labels = []
+        for label in labels:
+            row_frame = tk.Frame(details_frame, bg="white")
+            row_frame.pack(fill=tk.X, pady=8)
+            
+            tk.Label(row_frame, text=label, font=("Arial", 11),
+                    bg="white", fg=self.colors['secondary'], width=15, anchor=tk.W).pack(side=tk.LEFT)
+            value_labels.append(tk.Label(row_frame, font=("Arial", 11, "bold"), bg="white", fg=self.colors['dark']))
+            value_labels[-1].pack(side=tk.LEFT)
+        
+        table = None
+        if leaderboard:
+            tk.Label(self.content_frame, text=leaderboard_title, font=("Arial", 14, "bold"),
+                    bg=self.colors['light'], fg=self.colors['dark']).pack(anchor=tk.W)
+            table = self.create_leaderboard_table(self.content_frame, leaderboard())
+        
+        def refresh(op=None, students=None):
+            student = get_student()
+            if student is None:
+                header_label.config(text="No students found")
+                for value_label in value_labels:
+                    value_label.config(text="")
+            else:
+                color = self.get_grade_color(student.grade)
+                card_header.config(bg=color)
+                header_label.config(text=f"{student.name} - Grade {student.grade}", bg=color)
+                values = [student.student_code, f"{student.coursework_total}/60", f"{student.exam_mark}/100",
+                          f"{student.total_score}/160", f"{student.percentage:.1f}%"]
+                for value_label, value in zip(value_labels, values):
+                    value_label.config(text=value)
+            if table is not None and op is not None:
+                table.set_students(leaderboard())
+        
+        refresh()
+        self.view_refresh = refresh
+    
+    def create_leaderboard_table(self, parent, students):
+        headers = ["Rank", "Student Name", "Student Code", "Total", "Total %", "Grade"]
+        widths = [6, 25, 12, 8, 10, 8]
+        def row_values(student):
+            # Leaderboards are short, so the rank is just the position in the current list
+            return (table.students.index(student) + 1, student.name, student.student_code,
+                    f"{student.total_score}/160", f"{student.percentage:.1f}%", student.grade)
+        
+        table = VirtualStudentTable(parent, headers, widths, row_values, self.get_grade_color)
+        table.pack(fill=tk.BOTH, expand=True, pady=10)
+        table.set_students(students)
+        return table
+    
+    def sort_students(self):
+        # Create sort dialog
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Sort & Filter Students")
+        dialog.geometry("420x620")
+        dialog.configure(bg='white')
+        
+        tk.Label(dialog, text="Sort Students By", font=("Arial", 14, "bold"),
+                bg="white", fg=self.colors['dark']).pack(pady=20)
+        
+        options = [
+            ("Student Name", "name"),
+            ("Student Code", "code"),
+            ("Percentage", "percentage"),
+            ("Grade", "grade"),
+            ("Coursework", "coursework"),
+            ("Exam Mark", "exam")
+        ]
+        labels = {value: text for text, value in options}
+        fields = {text: value for text, value in options}
+        # Fields that read best high-to-low by default
+        descending_fields = {"percentage", "coursework", "exam"}
+        
+        form_frame = tk.Frame(dialog, bg="white")
+        form_frame.pack(fill=tk.X, padx=30)
+        
+        current = list(self.sort_order) or [("name", False)]
+        levels = []
+        for i, caption in enumerate(["Sort by", "Then by", "Then by"]):
+            field, descending = current[i] if i < len(current) else (None, False)
+            field_var = tk.StringVar(value=labels[field] if field else "(none)")
+            descending_var = tk.BooleanVar(value=descending)
+            
+            tk.Label(form_frame, text=caption, font=("Arial", 11), bg="white").grid(row=i, column=0, sticky=tk.W, pady=8)
+            combo = ttk.Combobox(form_frame, textvariable=field_var, state="readonly", width=16,
+                                 values=[text for text, value in options] + ([] if i == 0 else ["(none)"]))
+            combo.grid(row=i, column=1, padx=10, pady=8)
+            combo.bind("<<ComboboxSelected>>",
+                       lambda e, f=field_var, d=descending_var: d.set(fields.get(f.get()) in descending_fields))
+            tk.Checkbutton(form_frame, text="Descending", variable=descending_var,
+                          bg="white", font=("Arial", 10)).grid(row=i, column=2, sticky=tk.W)
+            levels.append((field_var, descending_var))
+        
+        # Filters
+        tk.Label(dialog, text="Filter Students", font=("Arial", 14, "bold"),
+                bg="white", fg=self.colors['dark']).pack(pady=(20, 10))
+        
+        filter_frame = tk.Frame(dialog, bg="white")
+        filter_frame.pack(fill=tk.X, padx=30)
+        
+        tk.Label(filter_frame, text="Grades", font=("Arial", 11), bg="white").grid(row=0, column=0, sticky=tk.W, pady=8)
+        grade_frame = tk.Frame(filter_frame, bg="white")
+        grade_frame.grid(row=0, column=1, columnspan=2, sticky=tk.W, padx=10)
+        selected_grades = self.filters.get('grades', GRADES)
+        grade_vars = {}
+        for grade in GRADES:
+            grade_vars[grade] = tk.BooleanVar(value=grade in selected_grades)
+            tk.Checkbutton(grade_frame, text=grade, variable=grade_vars[grade], bg="white",
+                          fg=self.get_grade_color(grade), font=("Arial", 10, "bold")).pack(side=tk.LEFT)
+        
+        filter_entries = {}
+        filter_fields = [
+            ("Min Percentage", 'min_percentage'),
+            ("Max Percentage", 'max_percentage'),
+            ("Min Exam Mark", 'min_exam'),
+            ("Name Starts With", 'name_prefix')
+        ]
+        for i, (label, key) in enumerate(filter_fields, start=1):
+            tk.Label(filter_frame, text=label, font=("Arial", 11), bg="white").grid(row=i, column=0, sticky=tk.W, pady=8)
+            entry = tk.Entry(filter_frame, font=("Arial", 10), width=18)
+            if key in self.filters:
+                entry.insert(0, str(self.filters[key]))
+            entry.grid(row=i, column=1, columnspan=2, sticky=tk.W, padx=10, pady=8)
+            filter_entries[key] = entry
+        
+        def apply_sort():
+            ordering = []
+            for field_var, descending_var in levels:
+                field = fields.get(field_var.get())
+                if field and field not in [f for f, d in ordering]:
+                    ordering.append((field, descending_var.get()))
+            
+            filters = {}
+            grades = [grade for grade in GRADES if grade_vars[grade].get()]
+            if len(grades) < len(GRADES):
+                filters['grades'] = grades
+            try:
+                for key in ('min_percentage', 'max_percentage'):
+                    if filter_entries[key].get().strip():
+                        filters[key] = float(filter_entries[key].get())
+                if filter_entries['min_exam'].get().strip():
+                    filters['min_exam'] = int(filter_entries['min_exam'].get())
+            except ValueError:
+                messagebox.showerror("Error", "Please enter valid numbers", parent=dialog)
+                return
+            if filter_entries['name_prefix'].get().strip():
+                filters['name_prefix'] = filter_entries['name_prefix'].get().strip()
+            
+            self.sort_order = ordering
+            self.filters = filters
+            
+            dialog.destroy()
+            self.view_all_students()
+        
+        def clear_filters():
+            self.filters = {}
+            dialog.destroy()
+            self.view_all_students()
+        
+        button_frame = tk.Frame(dialog, bg="white")
+        button_frame.pack(pady=20)
+        tk.Button(button_frame, text="Apply", font=("Arial", 12),
+                 bg=self.colors['primary'], fg="white", command=apply_sort).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Clear Filters", font=("Arial", 12),
+                 bg=self.colors['secondary'], fg="white", command=clear_filters).pack(side=tk.LEFT, padx=5)
+    
+    def add_student(self):
+        self.show_add_student_dialog()
+    
+    def import_students(self):
+        filename = filedialog.askopenfilename(title="Import Students",
+                                              filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if not filename:
+            return
+        
+        def read_students():
+            # Parsing and validation run on the worker; only the indexing happens on the Tk thread
+            errors = []
+            students = list(iter_csv_students(filename, lambda n, line, message: errors.append((n, line, message))))
+            return students, errors
+        
+        def imported(result):
+            students, errors = result
+            try:
+                added, add_errors = self.manager.bulk_add(students)
+            except Exception as e:
+                # Nothing was added: the backend write comes before the roster changes
+                messagebox.showerror("Error", f"Failed to import students: {str(e)}")
+                return
+            errors += [(None, record.name, message) for index, record, message in add_errors]
+            self.save_students()
+            
+            lines = [f"Line {line_number}: {message}" if line_number else f"{line}: {message}"
+                     for line_number, line, message in errors[:10]]
+            if len(errors) > 10:
+                lines.append(f"... and {len(errors) - 10} more")
+            summary = f"Imported {added} student(s)."
+            if errors:
+                summary += f"\n\n{len(errors)} row(s) skipped:\n" + "\n".join(lines)
+            messagebox.showinfo("Import Complete", summary)
+        
+        self.io.submit(read_students, imported,
+                       lambda e: messagebox.showerror("Error", f"Failed to import data: {str(e)}"))
+    
+    def export_students(self):
+        filename = filedialog.asksaveasfilename(title="Export Students", defaultextension=".csv",
+                                                filetypes=[("CSV files", "*.csv"), ("Student marks text", "*.txt"),
+                                                           ("Binary roster", "*.bin"), ("SQLite database", "*.db")])
+        if not filename:
+            return
+        self.io.submit(lambda: self.manager.export(filename),
+                       lambda result: messagebox.showinfo("Success", f"Exported {len(self.manager.students)} students to {os.path.basename(filename)}"),
+                       lambda e: messagebox.showerror("Error", f"Failed to export data: {str(e)}"))
+    
+    def update_student(self):
+        student_code = simpledialog.askinteger("Update Student", "Enter student code to update:")
+        if student_code is None:
+            return
+        
+        student = self.manager.get_student_by_code(student_code)
+        if not student:
+            messagebox.showerror("Error", f"Student with code {student_code} not found.")
+            return
+        
+        self.show_update_student_dialog(student)
+    
+    def delete_student(self):
+        student_code = simpledialog.askinteger("Delete Student", "Enter student code to delete:")
+        if student_code is None:
+            return
+        
+        student = self.manager.get_student_by_code(student_code)
+        if not student:
+            messagebox.showerror("Error", f"Student with code {student_code} not found.")
+            return
+        
+        confirm = messagebox.askyesno("Confirm Delete", 
+                                     f"Are you sure you want to delete {student.name}?")
+        if confirm:
+            success, message = self.manager.delete_student(student_code)
+            if success:
+                self.save_students()
+                messagebox.showinfo("Success", message)
+            else:
+                messagebox.showerror("Error", message)
+    
+    def show_add_student_dialog(self):
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Add New Student")
+        dialog.geometry("400x500")
+        dialog.configure(bg='white')
+        
+        tk.Label(dialog, text="Add New Student", font=("Arial", 16, "bold"),
+                bg="white", fg=self.colors['dark']).pack(pady=20)
+        
+        form_frame = tk.Frame(dialog, bg="white")
+        form_frame.pack(fill=tk.BOTH, expand=True, padx=30)
+        
+        entries = {}
+        fields = [
+            ("Student Code", "entry"),
+            ("Student Name", "entry"), 
+            ("Coursework 1 (0-20)", "entry"),
+            ("Coursework 2 (0-20)", "entry"),
+            ("Coursework 3 (0-20)", "entry"),
+            ("Exam Mark (0-100)", "entry")
+        ]
+        
+        for i, (label, field_type) in enumerate(fields):
+            tk.Label(form_frame, text=label, font=("Arial", 10), bg="white").grid(row=i, column=0, sticky=tk.W, pady=8)
+            entry = tk.Entry(form_frame, font=("Arial", 10), width=20)
+            entry.grid(row=i, column=1, pady=8, padx=10)
+            entries[label] = entry
+        
+        def submit():
+            try:
+                code = int(entries["Student Code"].get())
+                name = entries["Student Name"].get()
+                m1 = int(entries["Coursework 1 (0-20)"].get())
+                m2 = int(entries["Coursework 2 (0-20)"].get())
+                m3 = int(entries["Coursework 3 (0-20)"].get())
+                exam = int(entries["Exam Mark (0-100)"].get())
+                
+                if not (1000 <= code <= 9999):
+                    messagebox.showerror("Error", "Student code must be between 1000-9999")
+                    return
+                if not all(0 <= mark <= 20 for mark in [m1, m2, m3]):
+                    messagebox.showerror("Error", "Coursework marks must be 0-20")
+                    return
+                if not (0 <= exam <= 100):
+                    messagebox.showerror("Error", "Exam mark must be 0-100")
+                    return
+                
+                success, message = self.manager.add_student(code, name, m1, m2, m3, exam)
+                if success:
+                    self.save_students()
+                    messagebox.showinfo("Success", message)
+                    dialog.destroy()
+                else:
+                    messagebox.showerror("Error", message)
+            except ValueError:
+                messagebox.showerror("Error", "Please enter valid numbers")
+        
+        tk.Button(dialog, text="Add Student", font=("Arial", 12), 
+                 bg=self.colors['primary'], fg="white", command=submit).pack(pady=20)
+    
+    def show_update_student_dialog(self, student):
+        dialog = tk.Toplevel(self.root)
+        dialog.title(f"Update {student.name}")
+        dialog.geometry("400x500")
+        dialog.configure(bg='white')
+        
+        tk.Label(dialog, text=f"Update {student.name}", font=("Arial", 16, "bold"),
+                bg="white", fg=self.colors['dark']).pack(pady=20)
+        
+        form_frame = tk.Frame(dialog, bg="white")
+        form_frame.pack(fill=tk.BOTH, expand=True, padx=30)
+        
+        entries = {}
+        fields = [
+            ("Student Name", student.name),
+            ("Coursework 1", student.mark1),
+            ("Coursework 2", student.mark2), 
+            ("Coursework 3", student.mark3),
+            ("Exam Mark", student.exam_mark)
+        ]
+        
+        for i, (label, value) in enumerate(fields):
+            tk.Label(form_frame, text=label, font=("Arial", 10), bg="white").grid(row=i, column=0, sticky=tk.W, pady=8)
+            entry = tk.Entry(form_frame, font=("Arial", 10), width=20)
+            entry.insert(0, str(value))
+            entry.grid(row=i, column=1, pady=8, padx=10)
+            entries[label] = entry
+        
+        def submit():
+            try:
+                name = entries["Student Name"].get()
+                m1 = int(entries["Coursework 1"].get())
+                m2 = int(entries["Coursework 2"].get())
+                m3 = int(entries["Coursework 3"].get())
+                exam = int(entries["Exam Mark"].get())
+                
+                if not all(0 <= mark <= 20 for mark in [m1, m2, m3]):
+                    messagebox.showerror("Error", "Coursework marks must be 0-20")
+                    return
+                if not (0 <= exam <= 100):
+                    messagebox.showerror("Error", "Exam mark must be 0-100")
+                    return
+                
+                success, message = self.manager.update_student(
+                    student.student_code, name=name, mark1=m1, mark2=m2, mark3=m3, exam_mark=exam
+                )
+                if success:
+                    self.save_students()
+                    messagebox.showinfo("Success", message)
+                    dialog.destroy()
+                else:
+                    messagebox.showerror("Error", message)
+            except ValueError:
+                messagebox.showerror("Error", "Please enter valid numbers")
+        
+        tk.Button(dialog, text="Update Student", font=("Arial", 12),
+                 bg=self.colors['primary'], fg="white", command=submit).pack(pady=20)
+
+def main():
+    root = tk.Tk()
+    app = ModernStudentManagerApp(root)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Median, quartile, spread and histogram statistics for each mark component"""
+import math
+from bisect import bisect_right
+from itertools import accumulate
+
+from student import MARK_MAXIMUMS
+
+# Mark components and their maximum scores
+COMPONENTS = dict(MARK_MAXIMUMS, total_score=160)
+
+COMPONENT_LABELS = {
+    'mark1': "Coursework 1",
+    'mark2': "Coursework 2",
+    'mark3': "Coursework 3",
+    'exam_mark': "Exam",
+    'coursework_total': "Coursework",
+    'total_score': "Overall",
+}
+
+class Distribution:
+    """Statistics of one integer mark component, read off an exact count histogram.
+    
+    Marks are small integers, so counts[v] (students scoring v) is exact and
+    quantiles come from a cumulative-count search instead of sorting the roster.
+    """
+    def __init__(self, counts, maximum):
+        self.counts = list(counts)
+        self.maximum = maximum
+        self.count = sum(self.counts)
+        self._cumulative = list(accumulate(self.counts))
+        total = sum(value * n for value, n in enumerate(self.counts))
+        squares = sum(value * value * n for value, n in enumerate(self.counts))
+        self.mean = total / self.count if self.count else 0
+        self.std = math.sqrt(max(squares / self.count - self.mean ** 2, 0)) if self.count else 0
+    
+    def _value_at(self, rank):
+        """The value of the rank-th smallest mark (0-based)"""
+        return bisect_right(self._cumulative, rank)
+    
+    def quantile(self, q):
+        """Linearly interpolated quantile, matching numpy.percentile's default"""
+        if not self.count:
+            return 0
+        position = q * (self.count - 1)
+        lower = math.floor(position)
+        low_value = self._value_at(lower)
+        if position == lower:
+            return low_value
+        return low_value + (self._value_at(lower + 1) - low_value) * (position - lower)
+    
+    @property
+    def median(self):
+        return self.quantile(0.5)
+    
+    @property
+    def lower_quartile(self):
+        return self.quantile(0.25)
+    
+    @property
+    def upper_quartile(self):
+        return self.quantile(0.75)
+    
+    def percentage_bins(self, bins=10):
+        """Student counts in equal percentage-of-maximum bins; a full mark falls in the last bin"""
+        result = [0] * bins
+        for value, n in enumerate(self.counts):
+            result[min(value * bins // self.maximum, bins - 1)] += n
+        return result
+
+def component_histogram(manager, component):
+    """Exact counts per mark value (0..maximum) for one component of the roster.
+    
+    The manager keeps every histogram up to date on add/update/delete, so this
+    does not depend on the roster size.
+    """
+    if component == 'total_score':
+        return manager.get_score_histogram()
+    return manager.get_mark_histogram(component)
+
+def compute_statistics(manager, components=COMPONENTS):
+    """Return {component: Distribution} for the manager's current roster"""
+    with manager.lock:
+        return {component: Distribution(component_histogram(manager, component), COMPONENTS[component])
+                for component in components}
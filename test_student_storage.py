@@ -0,0 +1,157 @@
+"""Tests for StudentManager persistence: journal replay, torn-line recovery and format round-trips"""
+import os
+import sqlite3
+
+import pytest
+
+import student
+from student import Student, StudentManager, write_roster_file
+
+ROSTER = [
+    Student(1001, "John Smith", 15, 12, 14, 68),
+    Student(1002, "Emma Johnson", 18, 16, 17, 82),
+    Student(1003, "Zoë Brown", 8, 10, 9, 45),
+]
+
+def rows(manager):
+    return sorted((s.student_code, s.name, s.mark1, s.mark2, s.mark3, s.exam_mark) for s in manager.students)
+
+@pytest.fixture
+def marks_file(tmp_path):
+    filename = str(tmp_path / "studentMarks.txt")
+    write_roster_file(filename, ROSTER)
+    return filename
+
+def test_journal_replay(marks_file):
+    manager = StudentManager(marks_file, journal=True)
+    manager.add_student(1004, "Sarah Davis", 16, 15, 14, 72)
+    manager.update_student(1001, exam_mark=90)
+    manager.delete_student(1002)
+    assert manager.save_data()
+    expected = rows(manager)
+
+    # Edits only reach the journal; the canonical file is untouched until compaction
+    with open(marks_file, encoding="utf-8") as f:
+        assert f.readline() == "3\n"
+    assert os.path.exists(marks_file + ".journal")
+
+    reloaded = StudentManager(marks_file, journal=True)
+    assert rows(reloaded) == expected
+    assert reloaded.load_errors == []
+    assert reloaded.backend.journal_size() == 3
+
+    reloaded.compact()
+    assert not os.path.exists(marks_file + ".journal")
+    assert rows(StudentManager(marks_file)) == expected
+
+def test_torn_journal_line_is_skipped_and_terminated(marks_file):
+    manager = StudentManager(marks_file, journal=True)
+    manager.add_student(1004, "Sarah Davis", 16, 15, 14, 72)
+    assert manager.save_data()
+    # A crash mid-append leaves a partial record with no newline
+    with open(marks_file + ".journal", "a", encoding="utf-8") as f:
+        f.write("A,1005,David Wil")
+
+    reloaded = StudentManager(marks_file, journal=True)
+    assert [code for code, *rest in rows(reloaded)] == [1001, 1002, 1003, 1004]
+    assert len(reloaded.load_errors) == 1
+    assert reloaded.load_errors[0][2].startswith("journal:")
+
+    # The next append starts on a fresh line instead of extending the torn one
+    reloaded.add_student(1006, "Ann Lee", 1, 2, 3, 4)
+    assert reloaded.save_data()
+    again = StudentManager(marks_file, journal=True)
+    assert rows(again) == rows(reloaded)
+    assert len(again.load_errors) == 1
+
+@pytest.mark.parametrize("extension", [".txt", ".csv", ".bin", ".db"])
+def test_round_trip(tmp_path, marks_file, extension):
+    source = StudentManager(marks_file)
+    destination = str(tmp_path / ("copy" + extension))
+    source.export(destination)
+
+    copy = StudentManager(destination)
+    assert rows(copy) == rows(source)
+    assert copy.load_errors == []
+    copy.add_student(1004, "Sarah Davis", 16, 15, 14, 72)
+    copy.delete_student(1001)
+    assert copy.save_data()
+    expected = rows(copy)
+    copy.close()
+
+    reopened = StudentManager(destination)
+    assert rows(reopened) == expected
+    reopened.close()
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_binary_round_trip_with_and_without_numpy(tmp_path, monkeypatch, use_numpy):
+    if use_numpy and student.np is None:
+        pytest.skip("NumPy is not installed")
+    if not use_numpy:
+        monkeypatch.setattr(student, "np", None)
+    filename = str(tmp_path / "roster.bin")
+    write_roster_file(filename, ROSTER)
+    manager = StudentManager(filename, journal=True)
+    assert rows(manager) == sorted((s.student_code, s.name, s.mark1, s.mark2, s.mark3, s.exam_mark)
+                                   for s in ROSTER)
+    manager.update_student(1003, mark1=20)
+    assert manager.save_data()
+    manager.compact()
+    manager.close()
+    assert StudentManager(filename).get_student_by_code(1003).mark1 == 20
+
+@pytest.mark.parametrize("contents", [
+    b"1\n1001,J\xffohn,1,2,3,4\n",  # not UTF-8
+    b"SMRX" + bytes(8),  # bad magic (written as .bin below)
+    b"SMRB\x01\x00\x00\x00\x05\x00\x00\x00",  # header claims 5 records, none follow
+])
+def test_unreadable_file_fails_without_being_overwritten(tmp_path, contents):
+    filename = str(tmp_path / ("roster.txt" if contents[:1] == b"1" else "roster.bin"))
+    with open(filename, "wb") as f:
+        f.write(contents)
+    with pytest.raises(ValueError):
+        StudentManager(filename, journal=True)
+    with open(filename, "rb") as f:
+        assert f.read() == contents
+
+def test_rejected_edits_are_not_journaled(marks_file):
+    manager = StudentManager(marks_file, journal=True)
+    assert not manager.add_student(4000, "", 1, 1, 1, 1)[0]
+    assert not manager.add_student(4001, "Ann", 21, 1, 1, 1)[0]
+    assert not manager.update_student(1001, mark1=5, exam_mark=101)[0]
+    assert not manager.update_student(1001, mark1=5, grade='A')[0]
+    assert manager.get_student_by_code(1001).mark1 == 15
+    assert manager.backend.journal_size() == 0
+
+def test_bulk_add_keeps_indexes_consistent(tmp_path):
+    manager = StudentManager(str(tmp_path / "roster.txt"))
+    manager.bulk_add([(code, f"Student {code}", code % 21, 5, 5, code % 101) for code in range(1, 201)])
+    for code in range(1, 151):
+        manager.delete_student(code)
+    manager.bulk_add([(code, f"Zed {code}", 5, 5, 5, 50) for code in range(300, 310)])
+
+    true_average = sum(s.percentage for s in manager.students) / len(manager.students)
+    assert manager.get_average_percentage() == pytest.approx(true_average)
+    assert len(manager.match_name_prefix("zed")) == 10
+    assert sum(len(matches) for matches in manager._by_name.values()) == len(manager.students)
+
+def test_failed_backend_write_leaves_roster_unchanged(tmp_path, marks_file, monkeypatch):
+    filename = str(tmp_path / "roster.db")
+    StudentManager(marks_file).export(filename)
+    manager = StudentManager(filename)
+    before = rows(manager)
+
+    def locked(*args):
+        raise sqlite3.OperationalError("database is locked")
+    monkeypatch.setattr(manager.backend, "record_change", locked)
+
+    assert not manager.add_student(1004, "Sarah Davis", 16, 15, 14, 72)[0]
+    assert not manager.update_student(1001, exam_mark=90)[0]
+    assert not manager.delete_student(1002)[0]
+    assert rows(manager) == before
+    assert manager.get_student_by_code(1004) is None
+    assert manager.get_average_percentage() == pytest.approx(
+        sum(s.percentage for s in manager.students) / len(manager.students))
+    monkeypatch.undo()
+    manager.close()
+    assert rows(StudentManager(filename)) == before